@@ -0,0 +1,30 @@
+"""Add hot path indexes for bookings and time slots
+
+Revision ID: 3f6b2a9c1d47
+Revises: 918cd1646b62
+Create Date: 2026-10-18 10:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6b2a9c1d47'
+down_revision: Union[str, None] = '918cd1646b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_time_slots_calendar_id_start_time_end_time', 'time_slots', ['calendar_id', 'start_time', 'end_time'], unique=False)
+    op.create_index('ix_bookings_time_slot_id_when', 'bookings', ['time_slot_id', 'when'], unique=False)
+    op.create_index('ix_bookings_guest_id_when', 'bookings', ['guest_id', 'when'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_bookings_guest_id_when', table_name='bookings')
+    op.drop_index('ix_bookings_time_slot_id_when', table_name='bookings')
+    op.drop_index('ix_time_slots_calendar_id_start_time_end_time', table_name='time_slots')
@@ -0,0 +1,52 @@
+"""Add weekday bitmask to time slots
+
+Revision ID: 7c1e5d2b8a90
+Revises: 3f6b2a9c1d47
+Create Date: 2026-10-18 14:03:52.771290
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Text
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e5d2b8a90'
+down_revision: Union[str, None] = '3f6b2a9c1d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+time_slots = sa.table(
+    'time_slots',
+    sa.column('id', sa.Integer()),
+    sa.column('weekdays', sa.JSON().with_variant(postgresql.JSONB(astext_type=Text()), 'postgresql')),
+    sa.column('weekday_mask', sa.Integer()),
+)
+
+
+def upgrade() -> None:
+    op.add_column('time_slots', sa.Column('weekday_mask', sa.Integer(), server_default='0', nullable=False))
+
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(time_slots.c.id, time_slots.c.weekdays)).all()
+    for time_slot_id, weekdays in rows:
+        if isinstance(weekdays, str):
+            weekdays = json.loads(weekdays)
+        mask = 0
+        for weekday in weekdays or []:
+            mask |= 1 << int(weekday)
+        connection.execute(
+            time_slots.update()
+            .where(time_slots.c.id == time_slot_id)
+            .values(weekday_mask=mask)
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('time_slots') as batch_op:
+        batch_op.drop_column('weekday_mask')
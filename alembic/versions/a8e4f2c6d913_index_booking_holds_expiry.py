@@ -0,0 +1,27 @@
+"""Index booking holds by owner and expiry
+
+Revision ID: a8e4f2c6d913
+Revises: f1b3c8d4a276
+Create Date: 2026-10-18 21:12:07.443190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e4f2c6d913'
+down_revision: Union[str, None] = 'f1b3c8d4a276'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_booking_holds_owner_id_expires_at', 'booking_holds', ['owner_id', 'expires_at'], unique=False)
+    op.create_index('ix_booking_holds_expires_at', 'booking_holds', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_booking_holds_expires_at', table_name='booking_holds')
+    op.drop_index('ix_booking_holds_owner_id_expires_at', table_name='booking_holds')
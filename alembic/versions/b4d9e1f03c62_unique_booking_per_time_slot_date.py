@@ -0,0 +1,46 @@
+"""Make bookings unique per time slot and date
+
+Revision ID: b4d9e1f03c62
+Revises: 7c1e5d2b8a90
+Create Date: 2026-10-18 15:21:07.114503
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d9e1f03c62'
+down_revision: Union[str, None] = '7c1e5d2b8a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Different guests could book the same occurrence before this revision, and the
+    # unique index can't be built over those rows. Which booking to keep is a
+    # product decision, so stop with the list instead of deleting any.
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT time_slot_id, \"when\", COUNT(*) AS bookings FROM bookings"
+        " GROUP BY time_slot_id, \"when\" HAVING COUNT(*) > 1"
+        " ORDER BY time_slot_id, \"when\""
+    )).all()
+    if duplicates:
+        listing = "\n".join(
+            f"  time_slot_id={row.time_slot_id} when={row.when}: {row.bookings} bookings"
+            for row in duplicates
+        )
+        raise RuntimeError(
+            "Cannot make bookings unique per time slot and date; resolve these duplicate"
+            f" bookings first, keeping one per occurrence:\n{listing}"
+        )
+
+    op.drop_index('ix_bookings_time_slot_id_when', table_name='bookings')
+    op.create_index('uq_bookings_time_slot_id_when', 'bookings', ['time_slot_id', 'when'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_bookings_time_slot_id_when', table_name='bookings')
+    op.create_index('ix_bookings_time_slot_id_when', 'bookings', ['time_slot_id', 'when'], unique=False)
@@ -0,0 +1,35 @@
+"""Add booking holds table
+
+Revision ID: f1b3c8d4a276
+Revises: d2a7c5e98b14
+Create Date: 2026-10-18 19:05:41.208317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlalchemy_utc
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1b3c8d4a276'
+down_revision: Union[str, None] = 'd2a7c5e98b14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('booking_holds',
+    sa.Column('time_slot_id', sa.Integer(), nullable=False),
+    sa.Column('when', sa.Date(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('expires_at', sqlalchemy_utc.sqltypes.UtcDateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['time_slot_id'], ['time_slots.id'], ),
+    sa.PrimaryKeyConstraint('time_slot_id', 'when')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('booking_holds')
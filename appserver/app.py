@@ -1,11 +1,66 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from appserver.apps.account.cache import token_cache, user_cache
 from appserver.apps.account.endpoints import router as account_router
+from appserver.apps.account.utils import password_hashing_engine
+from appserver.apps.calendar.cache import calendar_feed_event_cache, calendar_page_cache, free_busy_cache
 from appserver.apps.calendar.endpoints import router as calendar_router
+from appserver.apps.calendar.locks import calendar_locks
+from appserver.apps.calendar.sync import calendar_sync_worker
+from appserver.db import dispose_engine, init_engine
+from appserver.jobs import job_queue
+from appserver.instrumentation import SQLInstrumentationMiddleware, query_report
+from appserver.settings import settings
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    init_engine()
+    calendar_sync_worker.start()
+    job_queue.start()
+    yield
+    await job_queue.stop(timeout=settings.jobs_shutdown_timeout_seconds)
+    await calendar_sync_worker.stop()
+    password_hashing_engine.shutdown()
+    await dispose_engine()
+
+
+app = FastAPI(lifespan=lifespan, debug=settings.debug)
 
 def include_routers(_app: FastAPI):
     _app.include_router(account_router)
     _app.include_router(calendar_router)
 
-include_routers(app)
\ No newline at end of file
+
+def cache_stats() -> dict[str, dict]:
+    caches = {
+        "token": token_cache,
+        "user": user_cache,
+        "calendar_page": calendar_page_cache,
+        "calendar_feed_event": calendar_feed_event_cache,
+        "free_busy": free_busy_cache,
+    }
+    return {
+        name: {
+            "size": len(cache),
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "hit_ratio": cache.hit_ratio,
+        }
+        for name, cache in caches.items()
+    }
+
+
+def install_middlewares(_app: FastAPI):
+    _app.add_middleware(
+        SQLInstrumentationMiddleware,
+        debug=settings.debug,
+        repeat_threshold=settings.sql_repeat_threshold,
+    )
+    if settings.debug:
+        _app.add_api_route("/_debug/sql-report", query_report.snapshot, methods=["GET"])
+        _app.add_api_route("/_debug/cache-stats", cache_stats, methods=["GET"])
+        _app.add_api_route("/_debug/lock-stats", calendar_locks.stats.snapshot, methods=["GET"])
+
+include_routers(app)
+install_middlewares(app)
@@ -0,0 +1,116 @@
+import hashlib
+import time
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from appserver.libs.collections.bloom import BloomFilter
+from appserver.libs.collections.cache import TTLCache
+from .constants import (
+    REVOKED_TOKENS_CAPACITY,
+    TOKEN_CACHE_MAX_SIZE,
+    USER_CACHE_MAX_SIZE,
+    USER_CACHE_TTL_SECONDS,
+)
+from .models import User
+from .utils import decode_token, ACCESS_TOKEN_EXPIRE_MINUTES
+
+
+class TokenRevocationList:
+    """
+    In-memory set of revoked token IDs made of two rotating bloom filter generations.
+
+    A generation is retired after two `lifetime` periods, so a revoked ID stays visible
+    at least as long as any token can live. False positives only force a re-login.
+    """
+
+    def __init__(self, capacity: int, lifetime: float, clock=time.monotonic):
+        self.capacity = capacity
+        self.lifetime = lifetime
+        self.clock = clock
+        self.clear()
+
+    def _rotate(self) -> None:
+        now = self.clock()
+        elapsed = now - self._rotated_at
+        if elapsed < self.lifetime:
+            return
+        if elapsed < self.lifetime * 2:
+            self._previous = self._current
+        else:
+            self._previous = BloomFilter(self.capacity)
+        self._current = BloomFilter(self.capacity)
+        self._rotated_at = now
+
+    def revoke(self, token_id: str) -> None:
+        self._rotate()
+        self._current.add(token_id)
+
+    def is_revoked(self, token_id: str) -> bool:
+        self._rotate()
+        return token_id in self._current or token_id in self._previous
+
+    def clear(self) -> None:
+        self._current = BloomFilter(self.capacity)
+        self._previous = BloomFilter(self.capacity)
+        self._rotated_at = self.clock()
+
+
+token_cache = TTLCache(maxsize=TOKEN_CACHE_MAX_SIZE, clock=time.time)
+user_cache = TTLCache(maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
+revoked_tokens = TokenRevocationList(
+    capacity=REVOKED_TOKENS_CAPACITY,
+    lifetime=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def decode_token_cached(token: str) -> dict:
+    key = token_digest(token)
+    decoded = token_cache.get(key)
+    if decoded is None:
+        decoded = decode_token(token)
+        # Keep the claims only until the token itself expires.
+        token_cache.set(key, decoded, ttl=decoded["exp"] - time.time())
+    return dict(decoded)
+
+
+def revoke_token(token: str) -> None:
+    decoded = token_cache.pop(token_digest(token)) or decode_token(token)
+    if "jti" in decoded:
+        revoked_tokens.revoke(decoded["jti"])
+
+
+def is_token_revoked(decoded: dict) -> bool:
+    return "jti" in decoded and revoked_tokens.is_revoked(decoded["jti"])
+
+
+def _copy_columns(instance):
+    mapper = inspect(type(instance))
+    return type(instance)(**{attr.key: getattr(instance, attr.key) for attr in mapper.column_attrs})
+
+
+def snapshot_user(user: User) -> User:
+    """
+    Copy the loaded columns of `user` and its calendar into detached instances
+    that are not bound to any session.
+    """
+    snapshot = _copy_columns(user)
+    snapshot.calendar = None if user.calendar is None else _copy_columns(user.calendar)
+    if snapshot.calendar is not None:
+        make_transient_to_detached(snapshot.calendar)
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+def cache_user(user: User) -> None:
+    user_cache.set(user.username, snapshot_user(user))
+
+
+def get_cached_user(username: str) -> User | None:
+    return user_cache.get(username)
+
+
+def invalidate_user(username: str) -> None:
+    user_cache.pop(username)
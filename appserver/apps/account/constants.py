@@ -1 +1,5 @@
-AUTH_TOKEN_COOKIE_NAME = "auth_token"
\ No newline at end of file
+AUTH_TOKEN_COOKIE_NAME = "auth_token"
+TOKEN_CACHE_MAX_SIZE = 10_000
+USER_CACHE_MAX_SIZE = 10_000
+USER_CACHE_TTL_SECONDS = 30
+REVOKED_TOKENS_CAPACITY = 100_000
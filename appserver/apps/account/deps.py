@@ -3,32 +3,51 @@ from typing import Annotated
 from datetime import datetime, timezone, timedelta
 from sqlmodel import select
 from fastapi import Depends, Cookie, HTTPException, status
-from appserver.db import DbSessionDep
+from appserver.db import DbSessionDep, ReadSessionDep
+from appserver.settings import settings
 from .exceptions import InvalidTokenError, ExpiredTokenError, UserNotFoundError
 from .models import User
-from .utils import decode_token, ACCESS_TOKEN_EXPIRE_MINUTES
+from .schemas import Principal
+from .cache import cache_user, decode_token_cached, get_cached_user, is_token_revoked
+from .utils import ACCESS_TOKEN_EXPIRE_MINUTES
 from .constants import AUTH_TOKEN_COOKIE_NAME
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
-async def get_user(auth_token: str| None, db_session: AsyncSession) -> User | None:
-    if not auth_token:
-        return None
-    
+def get_verified_claims(auth_token: str) -> dict:
     try:
-        decoded = decode_token(auth_token)
+        decoded = decode_token_cached(auth_token)
     except Exception as e:
         raise InvalidTokenError() from e
-    
+
     expires_at = datetime.fromtimestamp(decoded["exp"], tz=timezone.utc)
     now = datetime.now(timezone.utc)
     if now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES) < expires_at:
         raise ExpiredTokenError()
-    
+
+    if is_token_revoked(decoded):
+        raise InvalidTokenError()
+    return decoded
+
+
+async def get_user(auth_token: str| None, db_session: AsyncSession, populate_cache: bool = True) -> User | None:
+    if not auth_token:
+        return None
+
+    decoded = get_verified_claims(auth_token)
+
+    # Cached snapshots are never handed out directly; each request gets its own
+    # session-bound copy, merged without touching the database.
+    snapshot = get_cached_user(decoded["sub"])
+    if snapshot is not None:
+        return await db_session.merge(snapshot, load=False)
+
     stmt = select(User).where(User.username == decoded["sub"])
     result = await db_session.execute(stmt)
-
-    return result.scalar_one_or_none()
+    user = result.scalar_one_or_none()
+    if user is not None and populate_cache:
+        cache_user(user)
+    return user
 
 
 async def get_current_user(
@@ -46,6 +65,22 @@ async def get_current_user(
 CurrentUserDep = Annotated[User, Depends(get_current_user)]
 
 
+async def get_current_user_for_read(
+        auth_token: Annotated[str, Cookie(...)],
+        db_session: ReadSessionDep,
+):
+    # A lagging replica may still return the profile from before an update, so
+    # only users read from the primary database are cached.
+    user = await get_user(auth_token, db_session, populate_cache=not settings.db_read_dsn)
+
+    if user is None:
+        raise UserNotFoundError()
+    return user
+
+
+CurrentUserReadDep = Annotated[User, Depends(get_current_user_for_read)]
+
+
 async def get_current_user_optional(
         db_session: DbSessionDep, 
         auth_token: Annotated[str | None, Cookie()] = None
@@ -55,3 +90,32 @@ async def get_current_user_optional(
 
 
 CurrentUserOptionalDep = Annotated[User | None, Depends(get_current_user_optional)]
+
+
+def get_principal(auth_token: str | None) -> Principal | None:
+    if not auth_token:
+        return None
+
+    decoded = get_verified_claims(auth_token)
+    return Principal(
+        username=decoded["sub"],
+        display_name=decoded["display_name"],
+        is_host=decoded["is_host"],
+        token_id=decoded.get("jti"),
+    )
+
+
+async def get_current_principal(auth_token: Annotated[str, Cookie(...)]) -> Principal:
+    return get_principal(auth_token)
+
+
+CurrentPrincipalDep = Annotated[Principal, Depends(get_current_principal)]
+
+
+async def get_current_principal_optional(
+        auth_token: Annotated[str | None, Cookie()] = None,
+) -> Principal | None:
+    return get_principal(auth_token)
+
+
+CurrentPrincipalOptionalDep = Annotated[Principal | None, Depends(get_current_principal_optional)]
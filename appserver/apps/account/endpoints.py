@@ -1,25 +1,30 @@
 from sys import is_stack_trampoline_active
-from fastapi import APIRouter, HTTPException, status
+from typing import Annotated
+from fastapi import APIRouter, Cookie, HTTPException, status
 from sqlalchemy import JSON
 from sqlmodel import select, func, update, delete
 from sqlalchemy.exc import IntegrityError
 from websockets import StatusLike
 from .exceptions import DuplicatedUsernameError, DuplicatedEmailError
 
-from appserver.db import DbSessionDep, create_async_engine, create_session
+from appserver.apps.calendar.cache import free_busy_cache, invalidate_calendar_page
+from appserver.apps.calendar.utils import delete_user_calendar_data
+from appserver.db import DbSessionDep, ReadSessionDep, create_async_engine, create_session
 from .models import User
 
 from .exceptions import PasswordMismatchError, UserNotFoundError
 from .schemas import SignupPayload, UserOut, LoginPayload, UpdateUserPayload
 from .utils import (
-    verify_password,
+    hash_password_async,
+    verify_password_async,
     create_access_token,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
 from datetime import datetime, timezone, timedelta
 from fastapi.responses import JSONResponse
 
-from .deps import CurrentUserDep
+from .cache import invalidate_user, revoke_token
+from .deps import CurrentPrincipalDep, CurrentUserDep, CurrentUserReadDep
 from .schemas import UserDetailOut
 from .constants import AUTH_TOKEN_COOKIE_NAME
 
@@ -28,7 +33,7 @@ router = APIRouter(prefix="/account")
 
 
 @router.get("/users/{username}")
-async def user_detail(username: str, session: DbSessionDep) -> User:
+async def user_detail(username: str, session: ReadSessionDep) -> User:
     stmt = select(User).where(User.username == username)
     result = await session.execute(stmt)
     user = result.scalar_one_or_none()
@@ -47,7 +52,12 @@ async def signup(payload: SignupPayload, session: DbSessionDep) -> UserOut:
     if count > 0:
         raise DuplicatedUsernameError()
     
-    user = User.model_validate(payload, from_attributes=True)
+    hashed_password = await hash_password_async(payload.password)
+    user = User.model_validate(
+        payload,
+        from_attributes=True,
+        update={"hashed_password": hashed_password},
+    )
     session.add(user)
     try:
         await session.commit()
@@ -65,7 +75,7 @@ async def login(payload: LoginPayload, session: DbSessionDep) -> User:
     if user is None:
         raise UserNotFoundError()
     
-    is_valid = verify_password(payload.password, user.hashed_password)
+    is_valid = await verify_password_async(payload.password, user.hashed_password)
     if not is_valid:
         raise PasswordMismatchError
 
@@ -99,7 +109,7 @@ async def login(payload: LoginPayload, session: DbSessionDep) -> User:
 
 
 @router.get("/@me", response_model=UserDetailOut)
-async def me(user: CurrentUserDep) -> User:
+async def me(user: CurrentUserReadDep) -> User:
     return user
 
 
@@ -110,23 +120,42 @@ async def update_user(
     session: DbSessionDep
 ) -> User:
     updated_data = payload.model_dump(exclude_none=True, exclude={"password", "password_again"})
+    hashed_password = await payload.get_hashed_password()
+    if hashed_password is not None:
+        updated_data["hashed_password"] = hashed_password
 
     stmt = update(User).where(User.username == user.username).values(**updated_data)
     await session.execute(stmt)
     await session.commit()
+    invalidate_user(user.username)
+    invalidate_calendar_page(user.username)
     return user
 
 
 @router.delete("/logout", status_code=status.HTTP_200_OK)
-async def logout(user: CurrentUserDep) -> JSONResponse:
+async def logout(
+    principal: CurrentPrincipalDep,
+    auth_token: Annotated[str, Cookie(...)],
+) -> JSONResponse:
+    revoke_token(auth_token)
     res = JSONResponse({})
     res.delete_cookie(AUTH_TOKEN_COOKIE_NAME)
     return res
 
 
 @router.delete("/unregister", status_code=status.HTTP_204_NO_CONTENT)
-async def unregister(user: CurrentUserDep, session: DbSessionDep) -> None:
+async def unregister(
+    user: CurrentUserDep,
+    session: DbSessionDep,
+    auth_token: Annotated[str, Cookie(...)],
+) -> None:
+    google_calendar_id = await delete_user_calendar_data(session, user.id)
     stmt = delete(User).where(User.username == user.username)
     await session.execute(stmt)
     await session.commit()
+    invalidate_user(user.username)
+    invalidate_calendar_page(user.username)
+    if google_calendar_id is not None:
+        free_busy_cache.pop(google_calendar_id)
+    revoke_token(auth_token)
     return None
@@ -47,3 +47,12 @@ class ExpiredTokenError(HTTPException):
             detail="Expired Token",
             headers={"WW-Authenticate", "Bearer"},
         )
+
+
+class PasswordHashingBusyError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many password requests. Try again later.",
+            headers={"Retry-After": "1"},
+        )
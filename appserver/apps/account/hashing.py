@@ -0,0 +1,73 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+from pwdlib import PasswordHash
+from .exceptions import PasswordHashingBusyError
+
+
+T = TypeVar("T")
+
+
+class PasswordHashingEngine:
+    """
+    Runs password hash/verify on a bounded thread pool so Argon2 never blocks the event loop.
+
+    At most `max_workers` jobs run at once and at most `max_queue_size` more wait for a worker.
+    Anything beyond that is rejected immediately with `PasswordHashingBusyError`.
+    """
+
+    def __init__(self, hasher: PasswordHash, max_workers: int, max_queue_size: int):
+        self.hasher = hasher
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self._in_flight - self.max_workers, 0)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hashing",
+                )
+            return self._executor
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue_size:
+                raise PasswordHashingBusyError()
+            self._in_flight += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        self._acquire()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.hasher.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(self.hasher.verify, password, hashed_password)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
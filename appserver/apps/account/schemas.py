@@ -1,9 +1,9 @@
 import random
 import string
 from typing import Self
-from pydantic import EmailStr, model_validator, AwareDatetime, computed_field
+from pydantic import EmailStr, model_validator, AwareDatetime, PrivateAttr
 from sqlmodel import SQLModel, Field
-from .utils import hash_password
+from .utils import hash_password_async
 
 
 class SignupPayload(SQLModel):
@@ -33,6 +33,13 @@ class UserOut(SQLModel):
     is_host: bool
 
 
+class Principal(SQLModel):
+    username: str
+    display_name: str
+    is_host: bool
+    token_id: str | None = None
+
+
 class LoginPayload(SQLModel):
     username: str = Field(min_length=4, max_length=40)
     password: str = Field(min_length=8, max_length=128)
@@ -50,6 +57,8 @@ class UpdateUserPayload(SQLModel):
     password: str | None = Field(default=None, min_length=8, max_length=128)
     password_again: str | None = Field(default=None, min_length=8, max_length=128)
 
+    _hashed_password: str | None = PrivateAttr(default=None)
+
     @model_validator(mode="after")
     def check_all_fields_are_none(self) -> Self:
         if not self.model_dump(exclude_none=True):
@@ -62,10 +71,7 @@ class UpdateUserPayload(SQLModel):
             raise ValueError("Password Not Matched")
         return self
     
-    @computed_field
-    @property
-    def hashed_password(self) -> str | None:
-        if self.password:
-            return hash_password(self.password)
-        return None
-    
\ No newline at end of file
+    async def get_hashed_password(self) -> str | None:
+        if self.password and self._hashed_password is None:
+            self._hashed_password = await hash_password_async(self.password)
+        return self._hashed_password
@@ -1,14 +1,24 @@
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any, Union
 from fastapi import Security
 from jose import jwt
 from pwdlib import PasswordHash
 from pwdlib.hashers.argon2 import Argon2Hasher
-from pwdlib.hashers.bcrypt import BcryptHasher  
+from pwdlib.hashers.bcrypt import BcryptHasher
+from .hashing import PasswordHashingEngine
 
 SECRET_KEY = "your-secret-key-here"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+PASSWORD_HASH_MAX_WORKERS = 4
+PASSWORD_HASH_MAX_QUEUE_SIZE = 64
+
+password_hashing_engine = PasswordHashingEngine(
+    PasswordHash((Argon2Hasher(), BcryptHasher())),
+    max_workers=PASSWORD_HASH_MAX_WORKERS,
+    max_queue_size=PASSWORD_HASH_MAX_QUEUE_SIZE,
+)
 
 
 def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None) -> str:
@@ -20,18 +30,25 @@ def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None
         expire = now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
     to_encode.update({"exp": expire})
+    to_encode.setdefault("jti", uuid.uuid4().hex)
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
 def hash_password(password: str) -> str:
-    password_hasher = PasswordHash((Argon2Hasher(), BcryptHasher()))
-    return password_hasher.hash(password)
+    return password_hashing_engine.hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    password_hasher = PasswordHash((Argon2Hasher(), BcryptHasher()))
-    return password_hasher.verify(plain_password, hashed_password)
+    return password_hashing_engine.hasher.verify(plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    return await password_hashing_engine.hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hashing_engine.verify(plain_password, hashed_password)
 
 
 def decode_token(token: str) -> dict:
@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Hashable
+from appserver.libs.collections.cache import TTLCache
+from appserver.libs.collections.intervals import merge_intervals, overlaps_any
+from appserver.settings import settings
+
+
+@dataclass(frozen=True)
+class CachedCalendarPage:
+    body: bytes
+    etag: str
+    last_modified: datetime
+    headers: dict[str, str]
+
+
+calendar_page_cache = TTLCache(
+    maxsize=settings.calendar_page_cache_size if settings.calendar_page_cache_enabled else 0,
+    ttl=settings.calendar_page_cache_ttl_seconds,
+)
+
+
+def get_cached_calendar_page(host_username: str) -> CachedCalendarPage | None:
+    if calendar_page_cache.maxsize <= 0:
+        return None
+    return calendar_page_cache.get(host_username)
+
+
+def cache_calendar_page(host_username: str, page: CachedCalendarPage) -> None:
+    calendar_page_cache.set(host_username, page)
+
+
+def invalidate_calendar_page(host_username: str) -> None:
+    calendar_page_cache.pop(host_username)
+
+
+# Rendered VEVENT blocks of the .ics feed. The key includes the version the block
+# was rendered from, so a changed booking misses and its stale block ages out.
+calendar_feed_event_cache = TTLCache(maxsize=settings.calendar_feed_event_cache_size)
+
+
+def get_cached_feed_event(booking_id: int, variant: str, version: Hashable) -> bytes | None:
+    return calendar_feed_event_cache.get((booking_id, variant, version))
+
+
+def cache_feed_event(booking_id: int, variant: str, version: Hashable, chunk: bytes) -> None:
+    calendar_feed_event_cache.set((booking_id, variant, version), chunk)
+
+
+# Busy times pulled from each host's external calendar by the sync worker, keyed by
+# google_calendar_id. Request handlers only read this; they never call the provider.
+free_busy_cache = TTLCache(
+    maxsize=settings.calendar_free_busy_cache_size,
+    ttl=settings.calendar_free_busy_ttl_seconds,
+)
+
+
+def store_busy_intervals(google_calendar_id: str, intervals: list[tuple[datetime, datetime]]) -> None:
+    free_busy_cache.set(google_calendar_id, merge_intervals(intervals))
+
+
+def is_busy(google_calendar_id: str, start: datetime, end: datetime) -> bool:
+    busy = free_busy_cache.get(google_calendar_id)
+    return busy is not None and overlaps_any(busy, start, end)
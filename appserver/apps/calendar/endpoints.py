@@ -1,28 +1,65 @@
-from datetime import datetime, timezone
-from fastapi import APIRouter, status
-from sqlmodel import select, and_, func, true
+import csv
+import io
+import json
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Annotated, AsyncIterator, Literal
+from fastapi import APIRouter, Body, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlmodel import select, and_, exists, func, insert, true, tuple_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from appserver.apps.account.cache import invalidate_user
 from appserver.apps.account.models import User
-from appserver.apps.account.deps import CurrentUserDep, CurrentUserOptionalDep
-from appserver.db import DbSessionDep
+from appserver.apps.account.deps import CurrentPrincipalOptionalDep, CurrentUserDep, CurrentUserReadDep
+from appserver.db import DbSessionDep, ReadSessionDep, violated_constraint
+from appserver.libs.collections.intervals import find_overlaps
+from appserver.libs.datetime.calendar import (
+    get_weekday_dates_in_range,
+    mask_to_weekdays,
+    weekdays_to_mask,
+)
+from appserver.libs.ical import escape_text, fold_line, format_floating, format_utc
+from appserver.libs.http.cursor import decode_cursor, encode_cursor
+from appserver.libs.http.conditional import format_http_date, is_not_modified, make_etag
+from appserver.settings import settings
 
+from .cache import (
+    CachedCalendarPage,
+    cache_calendar_page,
+    cache_feed_event,
+    get_cached_calendar_page,
+    get_cached_feed_event,
+    invalidate_calendar_page,
+    is_busy,
+)
 from .exceptions import (
     BookingAlreadyExistsError,
+    BookingHoldLimitExceededError,
     CalendarAlreadyExistsError,
     CalendarNotFoundError,
     GuestPermissionError,
+    HostBusyError,
     HostNotFoundError,
+    InvalidCursorError,
+    InvalidDateRangeError,
     PastBookingError,
     SelfBookingError,
+    SlotHeldError,
+    TimeSlotBatchOverlapError,
     TimeSlotNotFoundError,
     TimeSlotOverlapError,
 )
 from .models import Booking, Calendar, TimeSlot
 from .schemas import (
+    AvailableTimeSlotOut,
     BookingCreateIn,
+    BookingHoldIn,
+    BookingHoldOut,
     BookingOut,
+    BookingPageOut,
+    BookingSummaryOut,
     CalendarCreateIn,
     CalendarDetailOut,
     CalendarOut,
@@ -30,33 +67,440 @@ from .schemas import (
     TimeSlotCreateIn,
     TimeSlotOut,
 )
+from .holds import BookingHoldLimitError, booking_holds
+from .locks import calendar_locks
+from .jobs import job_queue
+from .sync import booking_event_uid
+
 
+DEFAULT_AVAILABILITY_DAYS = 28
+MAX_AVAILABILITY_DAYS = 366
+MAX_TIME_SLOT_BATCH_SIZE = 500
+DEFAULT_BOOKING_PAGE_SIZE = 50
+MAX_BOOKING_PAGE_SIZE = 200
+EXPORT_BATCH_SIZE = 500
+FEED_PRODUCT_ID = "-//coffee-chat-scheduler//Calendar Feed//EN"
+EXPORT_COLUMNS = ("id", "when", "start_time", "end_time", "topic", "description", "guest_username", "created_at")
 
 router = APIRouter()
 
-@router.get("/calendar/{host_username}", status_code=status.HTTP_200_OK)
+def _decode_booking_cursor(cursor: str) -> tuple[date, int]:
+    try:
+        when, booking_id = decode_cursor(cursor)
+        return date.fromisoformat(when), int(booking_id)
+    except (TypeError, ValueError) as exc:
+        raise InvalidCursorError() from exc
+
+
+async def _list_bookings_page(
+        session: AsyncSession,
+        stmt,
+        from_date: date | None,
+        to_date: date | None,
+        time_slot_id: int | None,
+        cursor: str | None,
+        limit: int,
+) -> BookingPageOut:
+    if from_date is not None:
+        stmt = stmt.where(Booking.when >= from_date)
+    if to_date is not None:
+        stmt = stmt.where(Booking.when <= to_date)
+    if time_slot_id is not None:
+        stmt = stmt.where(Booking.time_slot_id == time_slot_id)
+    if cursor is not None:
+        stmt = stmt.where(tuple_(Booking.when, Booking.id) > _decode_booking_cursor(cursor))
+
+    # One extra row tells whether another page follows.
+    stmt = stmt.order_by(Booking.when, Booking.id).limit(limit + 1)
+    result = await session.execute(stmt)
+    rows = result.mappings().all()
+
+    items = [BookingSummaryOut.model_validate(row) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last.when.isoformat(), last.id)
+    return BookingPageOut(items=items, next_cursor=next_cursor)
+
+
+def _booking_summary_select():
+    return (
+        select(
+            Booking.id,
+            Booking.when,
+            Booking.topic,
+            Booking.time_slot_id,
+            TimeSlot.start_time,
+            TimeSlot.end_time,
+        )
+        .join(TimeSlot, Booking.time_slot_id == TimeSlot.id)
+    )
+
+
+@router.get(
+    "/bookings",
+    status_code=status.HTTP_200_OK,
+    response_model=BookingPageOut,
+)
+async def guest_bookings(
+        user: CurrentUserReadDep,
+        session: ReadSessionDep,
+        from_date: Annotated[date | None, Query(alias="from")] = None,
+        to_date: Annotated[date | None, Query(alias="to")] = None,
+        time_slot_id: int | None = None,
+        cursor: str | None = None,
+        limit: Annotated[int, Query(ge=1, le=MAX_BOOKING_PAGE_SIZE)] = DEFAULT_BOOKING_PAGE_SIZE,
+) -> BookingPageOut:
+    stmt = _booking_summary_select().where(Booking.guest_id == user.id)
+    return await _list_bookings_page(session, stmt, from_date, to_date, time_slot_id, cursor, limit)
+
+
+@router.get(
+    "/calendar/bookings",
+    status_code=status.HTTP_200_OK,
+    response_model=BookingPageOut,
+)
+async def host_bookings(
+        user: CurrentUserReadDep,
+        session: ReadSessionDep,
+        from_date: Annotated[date | None, Query(alias="from")] = None,
+        to_date: Annotated[date | None, Query(alias="to")] = None,
+        time_slot_id: int | None = None,
+        cursor: str | None = None,
+        limit: Annotated[int, Query(ge=1, le=MAX_BOOKING_PAGE_SIZE)] = DEFAULT_BOOKING_PAGE_SIZE,
+) -> BookingPageOut:
+    if not user.is_host:
+        raise GuestPermissionError()
+
+    if user.calendar is None:
+        raise CalendarNotFoundError()
+
+    stmt = _booking_summary_select().where(TimeSlot.calendar_id == user.calendar.id)
+    return await _list_bookings_page(session, stmt, from_date, to_date, time_slot_id, cursor, limit)
+
+
+def _export_row(row) -> dict:
+    return {
+        column: value.isoformat() if isinstance(value, (date, time)) else value
+        for column, value in zip(EXPORT_COLUMNS, row)
+    }
+
+
+async def _stream_bookings_export(
+        session: AsyncSession,
+        stmt,
+        export_format: Literal["ndjson", "csv"],
+) -> AsyncIterator[bytes]:
+    if export_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        yield buffer.getvalue().encode()
+
+    # Server-side cursor: each partition is one `yield_per` batch, sent as one chunk.
+    result = await session.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    async for rows in result.partitions():
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerows(_export_row(row).values() for row in rows)
+            yield buffer.getvalue().encode()
+        else:
+            yield "".join(json.dumps(_export_row(row)) + "\n" for row in rows).encode()
+
+
+@router.get("/calendar/bookings/export", status_code=status.HTTP_200_OK)
+async def export_host_bookings(
+        user: CurrentUserReadDep,
+        session: ReadSessionDep,
+        export_format: Annotated[Literal["ndjson", "csv"], Query(alias="format")] = "ndjson",
+        from_date: Annotated[date | None, Query(alias="from")] = None,
+        to_date: Annotated[date | None, Query(alias="to")] = None,
+) -> StreamingResponse:
+    if not user.is_host:
+        raise GuestPermissionError()
+
+    if user.calendar is None:
+        raise CalendarNotFoundError()
+
+    stmt = (
+        select(
+            Booking.id,
+            Booking.when,
+            TimeSlot.start_time,
+            TimeSlot.end_time,
+            Booking.topic,
+            Booking.description,
+            User.username,
+            Booking.created_at,
+        )
+        .join(TimeSlot, Booking.time_slot_id == TimeSlot.id)
+        .join(User, Booking.guest_id == User.id)
+        .where(TimeSlot.calendar_id == user.calendar.id)
+        .order_by(Booking.when, Booking.id)
+    )
+    if from_date is not None:
+        stmt = stmt.where(Booking.when >= from_date)
+    if to_date is not None:
+        stmt = stmt.where(Booking.when <= to_date)
+
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        _stream_bookings_export(session, stmt, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="bookings.{export_format}"'},
+    )
+
 
+@router.get("/calendar/{host_username}", status_code=status.HTTP_200_OK)
 async def host_calendar_detail(
         host_username: str,
-        user: CurrentUserOptionalDep,
-        session: DbSessionDep
+        principal: CurrentPrincipalOptionalDep,
+        session: ReadSessionDep,
+        response: Response,
+        if_none_match: Annotated[str | None, Header()] = None,
+        if_modified_since: Annotated[str | None, Header()] = None,
 ) -> CalendarOut | CalendarDetailOut:
-    
+    is_owner = principal is not None and principal.username == host_username
+    if not is_owner:
+        page = get_cached_calendar_page(host_username)
+        if page is not None:
+            if is_not_modified(page.etag, page.last_modified, if_none_match, if_modified_since):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=page.headers)
+            return Response(content=page.body, media_type="application/json", headers=page.headers)
+
+    # User.calendar is joined-loaded, so host and calendar come back in one query.
     stmt = select(User).where(User.username == host_username)
     result = await session.execute(stmt)
     host = result.scalar_one_or_none()
     if host is None:
         raise HostNotFoundError()
 
-    stmt = select(Calendar).where(Calendar.host_id == host.id)
-    result = await session.execute(stmt)
-    calendar = result.scalar_one_or_none()
+    calendar = host.calendar
     if calendar is None:
         raise CalendarNotFoundError()
-    if user is not None and user.id == host.id:
+
+    etag = make_etag(
+        calendar.id,
+        int(calendar.updated_at.timestamp() * 1_000_000),
+        "detail" if is_owner else "public",
+    )
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_http_date(calendar.updated_at),
+        "Vary": "Cookie",
+    }
+    if is_not_modified(etag, calendar.updated_at, if_none_match, if_modified_since):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+
+    if is_owner:
         return CalendarDetailOut.model_validate(calendar)
-    
-    return CalendarOut.model_validate(calendar)
+
+    calendar_out = CalendarOut.model_validate(calendar)
+    # A lagging replica could put the page from before a write back into the
+    # cache right after the writer invalidated it, so only primary reads are cached.
+    if not settings.db_read_dsn:
+        cache_calendar_page(host_username, CachedCalendarPage(
+            body=calendar_out.model_dump_json().encode(),
+            etag=etag,
+            last_modified=calendar.updated_at,
+            headers=headers,
+        ))
+    return calendar_out
+
+
+@router.get(
+    "/calendar/{host_username}/availability",
+    status_code=status.HTTP_200_OK,
+    response_model=list[AvailableTimeSlotOut],
+)
+async def host_calendar_availability(
+        host_username: str,
+        session: ReadSessionDep,
+        from_date: Annotated[date | None, Query(alias="from")] = None,
+        to_date: Annotated[date | None, Query(alias="to")] = None,
+) -> list[AvailableTimeSlotOut]:
+    today = datetime.now(timezone.utc).date()
+    from_date = max(from_date or today, today)
+    to_date = to_date or from_date + timedelta(days=DEFAULT_AVAILABILITY_DAYS - 1)
+    if to_date < from_date or (to_date - from_date).days >= MAX_AVAILABILITY_DAYS:
+        raise InvalidDateRangeError()
+
+    stmt = (
+        select(User)
+        .where(User.username == host_username)
+        .where(User.is_host.is_(true()))
+    )
+    result = await session.execute(stmt)
+    host = result.scalar_one_or_none()
+    if host is None or host.calendar is None:
+        raise HostNotFoundError()
+
+    stmt = select(TimeSlot).where(TimeSlot.calendar_id == host.calendar.id)
+    result = await session.execute(stmt)
+    time_slots = result.scalars().all()
+
+    stmt = (
+        select(Booking.time_slot_id, Booking.when)
+        .join(TimeSlot, Booking.time_slot_id == TimeSlot.id)
+        .where(TimeSlot.calendar_id == host.calendar.id)
+        .where(Booking.when.between(from_date, to_date))
+    )
+    result = await session.execute(stmt)
+    booked = set(result.tuples().all())
+
+    dates_by_weekday = {
+        weekday: get_weekday_dates_in_range([weekday], from_date, to_date)
+        for weekday in range(7)
+    }
+    available = [
+        AvailableTimeSlotOut(
+            when=when,
+            time_slot_id=time_slot.id,
+            start_time=time_slot.start_time,
+            end_time=time_slot.end_time,
+        )
+        for time_slot in time_slots
+        for weekday in mask_to_weekdays(time_slot.weekday_mask)
+        for when in dates_by_weekday[weekday]
+        if (time_slot.id, when) not in booked
+        and not is_busy(
+            host.calendar.google_calendar_id,
+            datetime.combine(when, time_slot.start_time),
+            datetime.combine(when, time_slot.end_time),
+        )
+    ]
+    available.sort(key=lambda slot: (slot.when, slot.start_time))
+    return available
+
+
+def _render_feed_event(row, variant: str) -> bytes:
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{booking_event_uid(row.id)}",
+        f"DTSTAMP:{format_utc(row.updated_at)}",
+        f"DTSTART:{format_floating(row.when, row.start_time)}",
+        f"DTEND:{format_floating(row.when, row.end_time)}",
+    ]
+    if variant == "detail":
+        lines.append(f"SUMMARY:{escape_text(row.topic)}")
+        lines.append(f"DESCRIPTION:{escape_text(row.description)}")
+    else:
+        lines.append("SUMMARY:Busy")
+    lines.append("END:VEVENT")
+    return "".join(fold_line(line) for line in lines).encode()
+
+
+async def _stream_calendar_feed(
+        session: AsyncSession,
+        stmt,
+        header: bytes,
+        variant: str,
+) -> AsyncIterator[bytes]:
+    yield header
+    result = await session.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    async for rows in result.partitions():
+        chunks = []
+        for row in rows:
+            version = (row.updated_at, row.time_slot_updated_at)
+            chunk = get_cached_feed_event(row.id, variant, version)
+            if chunk is None:
+                chunk = _render_feed_event(row, variant)
+                if not settings.db_read_dsn:
+                    cache_feed_event(row.id, variant, version, chunk)
+            chunks.append(chunk)
+        yield b"".join(chunks)
+    yield b"END:VCALENDAR\r\n"
+
+
+@router.get("/calendar/{host_username}/feed.ics", status_code=status.HTTP_200_OK)
+async def host_calendar_feed(
+        host_username: str,
+        principal: CurrentPrincipalOptionalDep,
+        session: ReadSessionDep,
+        if_none_match: Annotated[str | None, Header()] = None,
+        if_modified_since: Annotated[str | None, Header()] = None,
+) -> Response:
+    stmt = (
+        select(User)
+        .where(User.username == host_username)
+        .where(User.is_host.is_(true()))
+    )
+    result = await session.execute(stmt)
+    host = result.scalar_one_or_none()
+    if host is None:
+        raise HostNotFoundError()
+
+    calendar = host.calendar
+    if calendar is None:
+        raise CalendarNotFoundError()
+
+    # Guests and anonymous subscribers only see when the host is busy.
+    variant = "detail" if principal is not None and principal.username == host_username else "public"
+
+    stmt = (
+        select(
+            func.count(Booking.id),
+            func.max(Booking.id),
+            func.max(Booking.updated_at),
+            func.max(TimeSlot.updated_at),
+        )
+        .select_from(TimeSlot)
+        .outerjoin(Booking, Booking.time_slot_id == TimeSlot.id)
+        .where(TimeSlot.calendar_id == calendar.id)
+    )
+    result = await session.execute(stmt)
+    booking_count, last_booking_id, bookings_updated_at, time_slots_updated_at = result.one()
+    # The host's display name is the feed's X-WR-CALNAME, so a rename changes the feed too.
+    last_modified = max(
+        value
+        for value in (host.updated_at, calendar.updated_at, bookings_updated_at, time_slots_updated_at)
+        if value is not None
+    )
+    etag = make_etag(
+        calendar.id,
+        booking_count,
+        last_booking_id or 0,
+        int(last_modified.timestamp() * 1_000_000),
+        host.display_name,
+        variant,
+    )
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_http_date(last_modified),
+        "Vary": "Cookie",
+    }
+    if is_not_modified(etag, last_modified, if_none_match, if_modified_since):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    header = "".join(fold_line(line) for line in (
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{FEED_PRODUCT_ID}",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{escape_text(host.display_name)}",
+    )).encode()
+    stmt = (
+        select(
+            Booking.id,
+            Booking.when,
+            Booking.topic,
+            Booking.description,
+            Booking.updated_at,
+            TimeSlot.start_time,
+            TimeSlot.end_time,
+            TimeSlot.updated_at.label("time_slot_updated_at"),
+        )
+        .join(TimeSlot, Booking.time_slot_id == TimeSlot.id)
+        .where(TimeSlot.calendar_id == calendar.id)
+        .order_by(Booking.when, Booking.id)
+    )
+    return StreamingResponse(
+        _stream_calendar_feed(session, stmt, header, variant),
+        media_type="text/calendar; charset=utf-8",
+        headers=headers,
+    )
 
 
 @router.post(
@@ -82,6 +526,8 @@ async def create_calendar(
         await session.commit()
     except IntegrityError as exc:
         raise CalendarAlreadyExistsError() from exc
+    invalidate_user(user.username)
+    invalidate_calendar_page(user.username)
     return calendar
 
 
@@ -111,6 +557,8 @@ async def update_calendar(
         user.calendar.google_calendar_id = payload.google_calendar_id
 
     await session.commit()
+    invalidate_user(user.username)
+    invalidate_calendar_page(user.username)
 
     return user.calendar
 
@@ -128,43 +576,115 @@ async def create_time_slot(
     if not user.is_host:
         raise GuestPermissionError()
     
-    stmt = select(TimeSlot).where(
-        and_(
-            TimeSlot.calendar_id == user.calendar.id,
-            TimeSlot.start_time < payload.end_time,
-            TimeSlot.end_time > payload.start_time
+    weekday_mask = weekdays_to_mask(payload.weekdays)
+    # Held through the commit so a concurrent request can't pass the same overlap check.
+    async with calendar_locks.lock(session, user.calendar.id):
+        stmt = select(
+            exists()
+            .where(TimeSlot.calendar_id == user.calendar.id)
+            .where(TimeSlot.start_time < payload.end_time)
+            .where(TimeSlot.end_time > payload.start_time)
+            .where(TimeSlot.weekday_mask.op("&")(weekday_mask) != 0)
         )
-    )
-    result = await session.execute(stmt)
-    existing_time_slots = result.scalars().all()
-
-    for existing_time_slot in existing_time_slots:
-        if any(day in existing_time_slot.weekdays for day in payload.weekdays):
+        result = await session.execute(stmt)
+        if result.scalar():
             raise TimeSlotOverlapError()
 
-    time_slot = TimeSlot(
-        calendar_id=user.calendar.id,
-        start_time=payload.start_time,
-        end_time=payload.end_time,
-        weekdays=payload.weekdays,
-    )
-    session.add(time_slot)
-    await session.commit()
+        time_slot = TimeSlot(
+            calendar_id=user.calendar.id,
+            start_time=payload.start_time,
+            end_time=payload.end_time,
+            weekdays=payload.weekdays,
+            weekday_mask=weekday_mask,
+        )
+        session.add(time_slot)
+        await session.commit()
+    invalidate_calendar_page(user.username)
     return time_slot
 
 
 @router.post(
-    "/bookings/{host_username}",
+    "/time-slots:batch",
     status_code=status.HTTP_201_CREATED,
-    response_model=BookingOut,
+    response_model=list[TimeSlotOut],
 )
-async def create_booking(
-    host_username: str,
+async def create_time_slots_batch(
     user: CurrentUserDep,
     session: DbSessionDep,
-    payload: BookingCreateIn
-) -> BookingOut:
-    
+    payload: Annotated[list[TimeSlotCreateIn], Body(min_length=1, max_length=MAX_TIME_SLOT_BATCH_SIZE)],
+) -> list[TimeSlotOut]:
+    if not user.is_host:
+        raise GuestPermissionError()
+
+    if user.calendar is None:
+        raise CalendarNotFoundError()
+
+    async with calendar_locks.lock(session, user.calendar.id):
+        stmt = select(TimeSlot.id, TimeSlot.start_time, TimeSlot.end_time, TimeSlot.weekday_mask).where(
+            TimeSlot.calendar_id == user.calendar.id
+        )
+        result = await session.execute(stmt)
+        existing = result.all()
+
+        # New slots are keyed by their payload index, stored ones by ("existing", id).
+        conflicts = []
+        for weekday in range(7):
+            bit = 1 << weekday
+            intervals = [
+                (slot.start_time, slot.end_time, ("existing", slot.id))
+                for slot in existing
+                if slot.weekday_mask & bit
+            ]
+            intervals.extend(
+                (item.start_time, item.end_time, index)
+                for index, item in enumerate(payload)
+                if weekday in item.weekdays
+            )
+            for first, second in find_overlaps(intervals):
+                if isinstance(first, tuple) and isinstance(second, tuple):
+                    continue
+                index, other = (second, first) if isinstance(first, tuple) else (first, second)
+                conflicts.append({
+                    "index": index,
+                    "weekday": weekday,
+                    "conflicts_with": other if isinstance(other, int) else {"time_slot_id": other[1]},
+                })
+        if conflicts:
+            raise TimeSlotBatchOverlapError(conflicts)
+
+        # Bulk inserts skip ORM events, so the weekday mask is filled in here.
+        stmt = insert(TimeSlot).returning(TimeSlot, sort_by_parameter_order=True)
+        result = await session.scalars(stmt, [
+            {
+                "calendar_id": user.calendar.id,
+                "start_time": item.start_time,
+                "end_time": item.end_time,
+                "weekdays": item.weekdays,
+                "weekday_mask": weekdays_to_mask(item.weekdays),
+            }
+            for item in payload
+        ])
+        time_slots = result.all()
+        await session.commit()
+    invalidate_calendar_page(user.username)
+    return time_slots
+
+
+def _is_duplicate_booking(exc: IntegrityError) -> bool:
+    constraint = violated_constraint(exc)
+    if constraint is not None:
+        return constraint == "uq_bookings_time_slot_id_when"
+    # SQLite reports the columns of the unique index instead of its name.
+    return "UNIQUE constraint failed: bookings.time_slot_id, bookings.when" in str(exc.orig)
+
+
+async def _get_bookable_time_slot(
+        session: AsyncSession,
+        host_username: str,
+        user: User,
+        when: date,
+        time_slot_id: int,
+) -> TimeSlot:
     stmt = (
         select(User)
         .where(User.username == host_username)
@@ -178,40 +698,118 @@ async def create_booking(
     if user.id == host.id:
         raise SelfBookingError()
     
-    if payload.when < datetime.now(timezone.utc).date():
+    if when < datetime.now(timezone.utc).date():
         raise PastBookingError()
 
     stmt = (
         select(TimeSlot)
-        .where(TimeSlot.id == payload.time_slot_id)
+        .where(TimeSlot.id == time_slot_id)
         .where(TimeSlot.calendar_id == host.calendar.id)
+        .where(TimeSlot.weekday_mask.op("&")(1 << when.weekday()) != 0)
     )
     result = await session.execute(stmt)
     time_slot = result.scalar_one_or_none()
     if time_slot is None:
         raise TimeSlotNotFoundError()
-    if payload.when.weekday() not in time_slot.weekdays:
-        raise TimeSlotNotFoundError()
-    
-    stmt = (
-        select(func.count())
-        .select_from(Booking)
-        .where(Booking.guest_id == user.id)
-        .where(Booking.time_slot_id == payload.time_slot_id)
+
+    # Busy times come from the free/busy cache; the external calendar is never called here.
+    if is_busy(
+        host.calendar.google_calendar_id,
+        datetime.combine(when, time_slot.start_time),
+        datetime.combine(when, time_slot.end_time),
+    ):
+        raise HostBusyError()
+
+    return time_slot
+
+
+@router.post(
+    "/bookings/{host_username}",
+    status_code=status.HTTP_201_CREATED,
+    response_model=BookingOut,
+)
+async def create_booking(
+    host_username: str,
+    user: CurrentUserDep,
+    session: DbSessionDep,
+    payload: BookingCreateIn
+) -> BookingOut:
+    # Checked first so guests racing for a held slot are turned away before any other work.
+    holder_id = await booking_holds.get_owner(session, payload.time_slot_id, payload.when)
+    if holder_id is not None and holder_id != user.id:
+        raise SlotHeldError()
+
+    time_slot = await _get_bookable_time_slot(
+        session, host_username, user, payload.when, payload.time_slot_id,
     )
-    result = await session.execute(stmt)
-    exists = result.scalar_one_or_none()
-    if exists:
-        raise BookingAlreadyExistsError()
 
     booking = Booking(
         guest_id=user.id,
         when=payload.when,
         topic=payload.topic,
         description=payload.description,
-        time_slot_id=payload.time_slot_id,
+        time_slot=time_slot,
     )
     session.add(booking)
-    await session.commit()
-    await session.refresh(booking)
+    try:
+        await session.flush()
+        job_queue.stage(session, "booking.created", booking_id=booking.id)
+        await booking_holds.release(session, payload.time_slot_id, payload.when, user.id)
+        await session.commit()
+    except IntegrityError as exc:
+        await session.rollback()
+        if _is_duplicate_booking(exc):
+            raise BookingAlreadyExistsError() from exc
+        raise
     return booking
+
+
+@router.post(
+    "/bookings/{host_username}/holds",
+    status_code=status.HTTP_201_CREATED,
+    response_model=BookingHoldOut,
+)
+async def create_booking_hold(
+    host_username: str,
+    user: CurrentUserDep,
+    session: DbSessionDep,
+    payload: BookingHoldIn,
+) -> BookingHoldOut:
+    try:
+        expires_at = await booking_holds.acquire(session, payload.time_slot_id, payload.when, user.id)
+    except BookingHoldLimitError as exc:
+        raise BookingHoldLimitExceededError() from exc
+    if expires_at is None:
+        raise SlotHeldError()
+
+    try:
+        await _get_bookable_time_slot(session, host_username, user, payload.when, payload.time_slot_id)
+        stmt = select(
+            exists()
+            .where(Booking.time_slot_id == payload.time_slot_id)
+            .where(Booking.when == payload.when)
+        )
+        result = await session.execute(stmt)
+        if result.scalar():
+            raise BookingAlreadyExistsError()
+    except HTTPException:
+        await booking_holds.release(session, payload.time_slot_id, payload.when, user.id)
+        raise
+
+    await session.commit()
+    return BookingHoldOut(when=payload.when, time_slot_id=payload.time_slot_id, expires_at=expires_at)
+
+
+@router.delete(
+    "/bookings/{host_username}/holds/{time_slot_id}/{when}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def release_booking_hold(
+    host_username: str,
+    time_slot_id: int,
+    when: date,
+    user: CurrentUserDep,
+    session: DbSessionDep,
+) -> None:
+    await booking_holds.release(session, time_slot_id, when, user.id)
+    await session.commit()
@@ -71,3 +71,54 @@ class BookingAlreadyExistsError(HTTPException):
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="The time slot is already booked."
         )
+
+
+class InvalidDateRangeError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid date range."
+        )
+
+
+class TimeSlotBatchOverlapError(HTTPException):
+    def __init__(self, conflicts: list[dict]):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                "message": "Overlapping timeslots in batch.",
+                "conflicts": conflicts,
+            },
+        )
+
+
+class InvalidCursorError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid pagination cursor."
+        )
+
+
+class HostBusyError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="The host is busy at that time."
+        )
+
+
+class SlotHeldError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="The time slot is held by another guest."
+        )
+
+
+class BookingHoldLimitExceededError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="You hold too many time slots already."
+        )
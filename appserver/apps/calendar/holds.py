@@ -0,0 +1,178 @@
+import time
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timedelta, timezone
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import delete, select
+
+from appserver.libs.collections.cache import TTLCache
+from appserver.settings import settings
+
+from .models import BookingHold
+
+
+class BookingHoldLimitError(Exception):
+    pass
+
+
+class BookingHoldTable(ABC):
+    """
+    Holds reserve a `(time_slot_id, when)` occurrence for one guest until they expire.
+
+    `acquire` returns the expiry of the caller's hold, or None when another guest
+    holds the occurrence. Acquiring a hold the caller already owns keeps its
+    original expiry, so a hold can't be renewed past the TTL, and a guest can own
+    at most `max_per_owner` live holds before `BookingHoldLimitError` is raised.
+    Writes of the database backend join the caller's transaction, so the caller
+    commits them.
+    """
+
+    def __init__(self, ttl: float, max_per_owner: int):
+        self.ttl = ttl
+        self.max_per_owner = max_per_owner
+
+    @abstractmethod
+    async def acquire(self, session: AsyncSession, time_slot_id: int, when: date, owner_id: int) -> datetime | None:
+        ...
+
+    @abstractmethod
+    async def get_owner(self, session: AsyncSession, time_slot_id: int, when: date) -> int | None:
+        ...
+
+    @abstractmethod
+    async def release(self, session: AsyncSession, time_slot_id: int, when: date, owner_id: int) -> None:
+        ...
+
+
+class InMemoryBookingHoldTable(BookingHoldTable):
+    """
+    Holds in a per-process TTL table. Every operation is O(1) and never touches the database.
+    """
+
+    def __init__(self, ttl: float, max_per_owner: int, maxsize: int):
+        super().__init__(ttl, max_per_owner)
+        self.holds = TTLCache(maxsize=maxsize, ttl=ttl, clock=time.time)
+        # owner_id -> {key: expires_at}; an owner's entry outlives all of its holds.
+        self.owned = TTLCache(maxsize=maxsize, ttl=ttl, clock=time.time)
+
+    def _live_owned(self, owner_id: int) -> dict:
+        now = datetime.now(timezone.utc)
+        owned = self.owned.get(owner_id) or {}
+        return {key: expires_at for key, expires_at in owned.items() if expires_at > now}
+
+    async def acquire(self, session: AsyncSession, time_slot_id: int, when: date, owner_id: int) -> datetime | None:
+        key = (time_slot_id, when)
+        held = self.holds.get(key)
+        if held is not None:
+            return held[1] if held[0] == owner_id else None
+        owned = self._live_owned(owner_id)
+        if len(owned) >= self.max_per_owner:
+            raise BookingHoldLimitError()
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.ttl)
+        self.holds.set(key, (owner_id, expires_at))
+        owned[key] = expires_at
+        self.owned.set(owner_id, owned)
+        return expires_at
+
+    async def get_owner(self, session: AsyncSession, time_slot_id: int, when: date) -> int | None:
+        held = self.holds.get((time_slot_id, when))
+        return None if held is None else held[0]
+
+    async def release(self, session: AsyncSession, time_slot_id: int, when: date, owner_id: int) -> None:
+        key = (time_slot_id, when)
+        held = self.holds.get(key)
+        if held is not None and held[0] == owner_id:
+            self.holds.pop(key)
+            owned = self.owned.get(owner_id)
+            if owned is not None:
+                owned.pop(key, None)
+
+    def clear(self) -> None:
+        self.holds.clear()
+        self.owned.clear()
+
+
+class DatabaseBookingHoldTable(BookingHoldTable):
+    """
+    Holds in the `booking_holds` table, shared by every worker process.
+
+    Taking a hold is a single upsert that only overwrites an expired hold. Expired
+    rows of other occurrences are purged at most once per TTL.
+    """
+
+    def __init__(self, ttl: float, max_per_owner: int):
+        super().__init__(ttl, max_per_owner)
+        self._next_purge_at = 0.0
+
+    async def purge_expired(self, session: AsyncSession) -> None:
+        await session.execute(delete(BookingHold).where(BookingHold.expires_at <= datetime.now(timezone.utc)))
+
+    async def acquire(self, session: AsyncSession, time_slot_id: int, when: date, owner_id: int) -> datetime | None:
+        if time.monotonic() >= self._next_purge_at:
+            self._next_purge_at = time.monotonic() + self.ttl
+            await self.purge_expired(session)
+
+        now = datetime.now(timezone.utc)
+        stmt = (
+            select(BookingHold.time_slot_id, BookingHold.when, BookingHold.expires_at)
+            .where(BookingHold.owner_id == owner_id)
+            .where(BookingHold.expires_at > now)
+        )
+        result = await session.execute(stmt)
+        owned = {(row.time_slot_id, row.when): row.expires_at for row in result.all()}
+        if (time_slot_id, when) in owned:
+            return owned[(time_slot_id, when)]
+        if len(owned) >= self.max_per_owner:
+            raise BookingHoldLimitError()
+
+        expires_at = now + timedelta(seconds=self.ttl)
+        insert = postgresql_insert if session.bind.dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(BookingHold).values(
+            time_slot_id=time_slot_id,
+            when=when,
+            owner_id=owner_id,
+            expires_at=expires_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[BookingHold.time_slot_id, BookingHold.when],
+            set_={"owner_id": stmt.excluded.owner_id, "expires_at": stmt.excluded.expires_at},
+            where=BookingHold.expires_at <= now,
+        ).returning(BookingHold.owner_id)
+        result = await session.execute(stmt)
+        return expires_at if result.scalar_one_or_none() == owner_id else None
+
+    async def get_owner(self, session: AsyncSession, time_slot_id: int, when: date) -> int | None:
+        stmt = (
+            select(BookingHold.owner_id)
+            .where(BookingHold.time_slot_id == time_slot_id)
+            .where(BookingHold.when == when)
+            .where(BookingHold.expires_at > datetime.now(timezone.utc))
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def release(self, session: AsyncSession, time_slot_id: int, when: date, owner_id: int) -> None:
+        stmt = (
+            delete(BookingHold)
+            .where(BookingHold.time_slot_id == time_slot_id)
+            .where(BookingHold.when == when)
+            .where(BookingHold.owner_id == owner_id)
+        )
+        await session.execute(stmt)
+
+
+def create_booking_hold_table(backend: str, ttl: float, max_per_owner: int, maxsize: int) -> BookingHoldTable:
+    if backend == "memory":
+        return InMemoryBookingHoldTable(ttl, max_per_owner, maxsize)
+    if backend == "database":
+        return DatabaseBookingHoldTable(ttl, max_per_owner)
+    raise ValueError(f"Unknown booking hold backend: {backend}")
+
+
+booking_holds = create_booking_hold_table(
+    settings.booking_hold_backend,
+    ttl=settings.booking_hold_ttl_seconds,
+    max_per_owner=settings.booking_hold_max_per_guest,
+    maxsize=settings.booking_hold_max_size,
+)
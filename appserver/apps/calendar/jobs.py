@@ -0,0 +1,18 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.jobs import job_queue
+
+from .providers import CalendarProviderError
+from .sync import calendar_sync_worker
+
+
+@job_queue.job("booking.created", concurrency=4)
+async def booking_created(session: AsyncSession, booking_id: int) -> None:
+    # Pushed here rather than handed to the sync worker's in-memory queue, so the
+    # job, and its outbox row, only completes once the event is in the host's calendar.
+    if calendar_sync_worker.provider is None:
+        return
+    failed = await calendar_sync_worker.push_bookings(session, [booking_id])
+    if failed:
+        raise CalendarProviderError(f"Booking {booking_id} was not pushed to {', '.join(failed)}")
+
@@ -0,0 +1,87 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from .models import Calendar
+
+
+@dataclass
+class LockWaitStats:
+    acquisitions: int = 0
+    contended: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def record(self, wait: float, contended: bool) -> None:
+        self.acquisitions += 1
+        self.contended += int(contended)
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> dict:
+        return {
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "avg_wait_ms": self.total_wait * 1000 / self.acquisitions if self.acquisitions else 0.0,
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+    def clear(self) -> None:
+        self.acquisitions = 0
+        self.contended = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class CalendarLockManager:
+    """
+    Serializes writes to one calendar while writes to other calendars run in parallel.
+
+    Within a worker process an `asyncio.Lock` per calendar id is held for the
+    duration of the block. On databases with row locks the calendar row is also
+    locked with `SELECT ... FOR UPDATE`, which serializes workers until the
+    session's transaction ends, so the block should include the commit. Locks of
+    idle calendars are dropped, so the table only grows with concurrent writers.
+
+    The session must have no pending writes when the block is entered. A read-only
+    transaction it opened earlier, such as loading the current user, is committed
+    so its connection goes back to the pool before the lock is awaited. Otherwise a
+    request waiting on the lock could hold the only writer connection of the
+    SQLite profile, which the lock holder needs.
+    """
+
+    def __init__(self):
+        self._locks: dict[int, asyncio.Lock] = {}
+        self._waiters: dict[int, int] = {}
+        self.stats = LockWaitStats()
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    @asynccontextmanager
+    async def lock(self, session: AsyncSession, calendar_id: int) -> AsyncIterator[None]:
+        if session.in_transaction():
+            await session.commit()
+        lock = self._locks.setdefault(calendar_id, asyncio.Lock())
+        self._waiters[calendar_id] = self._waiters.get(calendar_id, 0) + 1
+        contended = lock.locked()
+        started = time.perf_counter()
+        try:
+            async with lock:
+                if session.bind.dialect.name != "sqlite":
+                    stmt = select(Calendar.id).where(Calendar.id == calendar_id).with_for_update()
+                    await session.execute(stmt)
+                self.stats.record(time.perf_counter() - started, contended)
+                yield
+        finally:
+            self._waiters[calendar_id] -= 1
+            if not self._waiters[calendar_id]:
+                del self._waiters[calendar_id]
+                del self._locks[calendar_id]
+
+
+calendar_locks = CalendarLockManager()
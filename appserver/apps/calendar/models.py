@@ -1,10 +1,13 @@
 from typing import TYPE_CHECKING
 from datetime import date, time, timezone, datetime
 
+from sqlalchemy import Index, event
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.mutable import MutableList
 from pydantic import AwareDatetime
 from sqlalchemy_utc import UtcDateTime
 from sqlmodel import SQLModel, Field, Relationship, Text, JSON, func
+from appserver.libs.datetime.calendar import weekdays_to_mask
 
 if TYPE_CHECKING:
     from apps.account.models import User
@@ -12,6 +15,8 @@ if TYPE_CHECKING:
 
 class Calendar(SQLModel, table=True):
     __tablename__ = "calendars" # type: ignore[arg-type]
+    # Server defaults come back in the INSERT ... RETURNING instead of a later SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: int = Field(default=None, primary_key=True)
     topics: list[str] = Field(
@@ -49,14 +54,25 @@ class Calendar(SQLModel, table=True):
 
 class TimeSlot(SQLModel, table=True):
     __tablename__ = "time_slots" # type: ignore[arg-type]
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_time_slots_calendar_id_start_time_end_time", "calendar_id", "start_time", "end_time"),
+    )
 
     id: int = Field(default=None, primary_key=True)
     start_time: time
     end_time: time
+    # MutableList flags in-place edits such as `weekdays.append(...)` as changes,
+    # so the ORM update below still recomputes `weekday_mask`.
     weekdays: list[int] = Field(
-        sa_type=JSON().with_variant(JSONB(astext_type=Text()), "postgresql"),
+        sa_type=MutableList.as_mutable(JSON().with_variant(JSONB(astext_type=Text()), "postgresql")),
         description="Weekdays available for booking"
     )
+    weekday_mask: int = Field(
+        default=0,
+        sa_column_kwargs={"server_default": "0"},
+        description="Bitmask of weekdays, bit N set for weekday N",
+    )
 
     calendar_id: int = Field(foreign_key="calendars.id")
     calendar: Calendar = Relationship(back_populates="time_slots")
@@ -81,9 +97,34 @@ class TimeSlot(SQLModel, table=True):
         },
     )
 
+    def __setattr__(self, name, value):
+        # SQLModel writes the raw value back after SQLAlchemy's attribute events, which
+        # drops MutableList's coercion, so plain lists are wrapped before they get there.
+        if name == "weekdays" and type(value) is list:
+            value = MutableList(value)
+        super().__setattr__(name, value)
+
+
+@event.listens_for(TimeSlot, "before_insert")
+@event.listens_for(TimeSlot, "before_update")
+def sync_weekday_mask(_mapper, _connection, time_slot: TimeSlot) -> None:
+    """
+    Keeps `weekday_mask` in step with `weekdays` on ORM flushes.
+
+    Core statements (`insert()`/`update()` on the table, bulk updates) bypass mapper
+    events and must set both columns themselves, as the batch create does.
+    """
+    time_slot.weekday_mask = weekdays_to_mask(time_slot.weekdays)
+
 
 class Booking(SQLModel, table=True):
     __tablename__ = "bookings" # type: ignore[arg-type]
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # One booking per time slot occurrence, enforced by the database.
+        Index("uq_bookings_time_slot_id_when", "time_slot_id", "when", unique=True),
+        Index("ix_bookings_guest_id_when", "guest_id", "when"),
+    )
 
     id: int = Field(default=None, primary_key=True)
     when: date
@@ -113,3 +154,19 @@ class Booking(SQLModel, table=True):
             "onupdate": lambda: datetime.now(timezone.utc),
         },
     )
+
+
+class BookingHold(SQLModel, table=True):
+    """
+    Short-lived reservation of one time slot occurrence, used by the database hold backend.
+    """
+    __tablename__ = "booking_holds" # type: ignore[arg-type]
+    __table_args__ = (
+        Index("ix_booking_holds_owner_id_expires_at", "owner_id", "expires_at"),
+        Index("ix_booking_holds_expires_at", "expires_at"),
+    )
+
+    time_slot_id: int = Field(foreign_key="time_slots.id", primary_key=True)
+    when: date = Field(primary_key=True)
+    owner_id: int = Field(foreign_key="users.id")
+    expires_at: AwareDatetime = Field(nullable=False, sa_type=UtcDateTime)
@@ -0,0 +1,87 @@
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class CalendarEvent:
+    uid: str
+    start: datetime
+    end: datetime
+    summary: str
+    description: str
+
+
+@dataclass(frozen=True)
+class BusyInterval:
+    start: datetime
+    end: datetime
+
+
+class CalendarProviderError(Exception):
+    pass
+
+
+class CalendarProvider(ABC):
+    """
+    An external calendar the sync worker pushes bookings to and reads busy times from.
+
+    Datetimes are floating local times, the same as time slots.
+    """
+
+    @abstractmethod
+    async def push_events(self, calendar_id: str, events: list[CalendarEvent]) -> None:
+        ...
+
+    @abstractmethod
+    async def fetch_busy(self, calendar_id: str, start: datetime, end: datetime) -> list[BusyInterval]:
+        ...
+
+
+class FakeCalendarProvider(CalendarProvider):
+    """
+    In-process provider for tests and offline benchmarks.
+
+    `latency` is added to every call and the next `failures` calls raise
+    `CalendarProviderError`, to exercise the worker's retries.
+    """
+
+    def __init__(self, latency: float = 0.0, failures: int = 0):
+        self.latency = latency
+        self.failures = failures
+        self.events: dict[str, dict[str, CalendarEvent]] = {}
+        self.busy: dict[str, list[BusyInterval]] = {}
+        self.push_calls = 0
+        self.fetch_calls = 0
+
+    async def _call(self) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.failures > 0:
+            self.failures -= 1
+            raise CalendarProviderError("Simulated provider failure.")
+
+    async def push_events(self, calendar_id: str, events: list[CalendarEvent]) -> None:
+        self.push_calls += 1
+        await self._call()
+        stored = self.events.setdefault(calendar_id, {})
+        for event in events:
+            stored[event.uid] = event
+
+    async def fetch_busy(self, calendar_id: str, start: datetime, end: datetime) -> list[BusyInterval]:
+        self.fetch_calls += 1
+        await self._call()
+        return [
+            interval
+            for interval in self.busy.get(calendar_id, [])
+            if interval.start < end and interval.end > start
+        ]
+
+
+def create_calendar_provider(backend: str | None) -> CalendarProvider | None:
+    if backend is None:
+        return None
+    if backend == "fake":
+        return FakeCalendarProvider()
+    raise ValueError(f"Unknown calendar sync backend: {backend}")
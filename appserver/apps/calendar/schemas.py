@@ -86,3 +86,35 @@ class BookingOut(SQLModel):
     time_slot: TimeSlotOut
     created_at: AwareDatetime
     updated_at: AwareDatetime
+
+
+class AvailableTimeSlotOut(SQLModel):
+    when: date
+    time_slot_id: int
+    start_time: time
+    end_time: time
+
+
+class BookingSummaryOut(SQLModel):
+    id: int
+    when: date
+    topic: str
+    time_slot_id: int
+    start_time: time
+    end_time: time
+
+
+class BookingPageOut(SQLModel):
+    items: list[BookingSummaryOut]
+    next_cursor: str | None
+
+
+class BookingHoldIn(SQLModel):
+    when: date
+    time_slot_id: int
+
+
+class BookingHoldOut(SQLModel):
+    when: date
+    time_slot_id: int
+    expires_at: AwareDatetime
@@ -0,0 +1,214 @@
+import asyncio
+import logging
+from collections import defaultdict
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.db import get_read_session_factory, get_session_factory
+from appserver.settings import settings
+
+from .cache import store_busy_intervals
+from .models import Booking, Calendar, TimeSlot
+from .providers import CalendarEvent, CalendarProvider, CalendarProviderError, create_calendar_provider
+
+
+logger = logging.getLogger(__name__)
+
+
+def booking_event_uid(booking_id: int) -> str:
+    return f"booking-{booking_id}@coffee-chat-scheduler"
+
+
+def _open_session() -> AbstractAsyncContextManager[AsyncSession]:
+    return get_session_factory()()
+
+
+def _open_read_session() -> AbstractAsyncContextManager[AsyncSession]:
+    return get_read_session_factory()()
+
+
+class CalendarSyncWorker:
+    """
+    Background sync between bookings and the hosts' external calendars.
+
+    `enqueue_booking` only puts an id on an in-memory queue, so request handlers
+    never wait on the provider. The push loop drains the queue in batches, groups
+    bookings by calendar and pushes each group with bounded concurrency and
+    exponential backoff. The pull loop periodically stores every host's busy
+    times in the free/busy cache.
+
+    Pushes read bookings through `session_factory`, the primary, because they were
+    committed moments earlier and a lagging replica would not return them yet. The
+    pull loop only lists calendars, so it may use `read_session_factory`.
+    """
+
+    def __init__(
+            self,
+            provider: CalendarProvider | None,
+            session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]] = _open_session,
+            read_session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]] | None = None,
+            batch_size: int = 50,
+            max_concurrency: int = 4,
+            max_retries: int = 5,
+            retry_backoff: float = 0.5,
+            pull_interval: float = 300,
+            pull_days: int = 28,
+            max_queue_size: int = 10_000,
+    ):
+        self.provider = provider
+        self.session_factory = session_factory
+        self.read_session_factory = read_session_factory or session_factory
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.pull_interval = pull_interval
+        self.pull_days = pull_days
+        self.max_queue_size = max_queue_size
+        self._max_concurrency = max_concurrency
+        self._semaphore: asyncio.Semaphore | None = None
+        self._queue: asyncio.Queue[int] | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        if self.provider is None or self.running:
+            return
+        # Created here so they bind to the running event loop.
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._tasks = [
+            asyncio.create_task(self._push_forever(), name="calendar-sync-push"),
+            asyncio.create_task(self._pull_forever(), name="calendar-sync-pull"),
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def enqueue_booking(self, booking_id: int) -> None:
+        if not self.running:
+            return
+        try:
+            self._queue.put_nowait(booking_id)
+        except asyncio.QueueFull:
+            logger.warning("Calendar sync queue is full; booking %d was not pushed", booking_id)
+
+    async def drain(self) -> None:
+        if self.running:
+            await self._queue.join()
+
+    async def _push_forever(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                async with self.session_factory() as session:
+                    await self.push_bookings(session, batch)
+            except Exception:
+                logger.exception("Failed to push %d bookings to external calendars", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _pull_forever(self) -> None:
+        while True:
+            try:
+                async with self.read_session_factory() as session:
+                    await self.refresh_free_busy(session)
+            except Exception:
+                logger.exception("Failed to pull busy times from external calendars")
+            await asyncio.sleep(self.pull_interval)
+
+    async def _with_retries(self, call, *args):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._semaphore:
+                    return await call(*args)
+            except CalendarProviderError:
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(self.retry_backoff * 2 ** attempt)
+
+    async def push_bookings(self, session: AsyncSession, booking_ids: list[int]) -> list[str]:
+        """
+        Push the bookings to their hosts' calendars and return the ids of the
+        calendars that still failed after retries.
+        """
+        stmt = (
+            select(
+                Booking.id,
+                Booking.when,
+                Booking.topic,
+                Booking.description,
+                TimeSlot.start_time,
+                TimeSlot.end_time,
+                Calendar.google_calendar_id,
+            )
+            .join(TimeSlot, Booking.time_slot_id == TimeSlot.id)
+            .join(Calendar, TimeSlot.calendar_id == Calendar.id)
+            .where(Booking.id.in_(booking_ids))
+        )
+        result = await session.execute(stmt)
+
+        events_by_calendar: dict[str, list[CalendarEvent]] = defaultdict(list)
+        for row in result.all():
+            events_by_calendar[row.google_calendar_id].append(CalendarEvent(
+                uid=booking_event_uid(row.id),
+                start=datetime.combine(row.when, row.start_time),
+                end=datetime.combine(row.when, row.end_time),
+                summary=row.topic,
+                description=row.description,
+            ))
+
+        results = await asyncio.gather(*(
+            self._with_retries(self.provider.push_events, calendar_id, events)
+            for calendar_id, events in events_by_calendar.items()
+        ), return_exceptions=True)
+        failed = []
+        for calendar_id, outcome in zip(events_by_calendar, results):
+            if isinstance(outcome, Exception):
+                logger.error("Giving up pushing bookings to %s: %s", calendar_id, outcome)
+                failed.append(calendar_id)
+        return failed
+
+    async def refresh_free_busy(self, session: AsyncSession) -> None:
+        result = await session.execute(select(Calendar.google_calendar_id))
+        calendar_ids = result.scalars().all()
+
+        # The window starts at today's UTC midnight rather than the server's local one;
+        # busy intervals stay naive wall-clock times like the slots they are compared to.
+        start = datetime.combine(datetime.now(timezone.utc).date(), datetime.min.time())
+        end = start + timedelta(days=self.pull_days)
+
+        async def pull(calendar_id: str) -> None:
+            intervals = await self._with_retries(self.provider.fetch_busy, calendar_id, start, end)
+            store_busy_intervals(calendar_id, [(interval.start, interval.end) for interval in intervals])
+
+        results = await asyncio.gather(*(pull(calendar_id) for calendar_id in calendar_ids), return_exceptions=True)
+        for calendar_id, outcome in zip(calendar_ids, results):
+            if isinstance(outcome, Exception):
+                logger.error("Giving up pulling busy times of %s: %s", calendar_id, outcome)
+
+
+calendar_sync_worker = CalendarSyncWorker(
+    provider=create_calendar_provider(settings.calendar_sync_backend),
+    read_session_factory=_open_read_session,
+    batch_size=settings.calendar_sync_batch_size,
+    max_concurrency=settings.calendar_sync_max_concurrency,
+    max_retries=settings.calendar_sync_max_retries,
+    retry_backoff=settings.calendar_sync_retry_backoff_ms / 1000,
+    pull_interval=settings.calendar_sync_pull_interval_seconds,
+    pull_days=settings.calendar_sync_pull_days,
+)
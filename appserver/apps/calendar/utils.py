@@ -0,0 +1,34 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import delete, or_, select
+
+from .models import Booking, BookingHold, Calendar, TimeSlot
+
+
+async def delete_user_calendar_data(session: AsyncSession, user_id: int) -> str | None:
+    """
+    Delete the rows that reference a user: their bookings and holds and, for a host,
+    the calendar with its time slots and the bookings made on them.
+
+    Runs in the caller's transaction so the user row can be deleted in the same
+    commit. Returns the host's `google_calendar_id`, or None for a guest.
+    """
+    result = await session.execute(
+        select(Calendar.id, Calendar.google_calendar_id).where(Calendar.host_id == user_id)
+    )
+    calendar = result.one_or_none()
+
+    if calendar is None:
+        await session.execute(delete(BookingHold).where(BookingHold.owner_id == user_id))
+        await session.execute(delete(Booking).where(Booking.guest_id == user_id))
+        return None
+
+    time_slot_ids = select(TimeSlot.id).where(TimeSlot.calendar_id == calendar.id)
+    await session.execute(delete(BookingHold).where(
+        or_(BookingHold.owner_id == user_id, BookingHold.time_slot_id.in_(time_slot_ids))
+    ))
+    await session.execute(delete(Booking).where(
+        or_(Booking.guest_id == user_id, Booking.time_slot_id.in_(time_slot_ids))
+    ))
+    await session.execute(delete(TimeSlot).where(TimeSlot.calendar_id == calendar.id))
+    await session.execute(delete(Calendar).where(Calendar.id == calendar.id))
+    return calendar.google_calendar_id
@@ -1,40 +1,232 @@
+from dataclasses import replace
 from typing import Annotated
 from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
+from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
     AsyncSession,
     AsyncEngine,
 )
+from appserver.settings import Settings, settings
 
 
-def create_engine(dsn: str):
-    return create_async_engine(
-        dsn,
-        echo=False,
+def engine_options(_settings: Settings) -> dict:
+    url = make_url(_settings.database_url)
+    options = {
+        "echo": _settings.db_echo,
+        "pool_pre_ping": _settings.db_pool_pre_ping,
+        "pool_recycle": _settings.db_pool_recycle,
+    }
+    if url.get_backend_name() == "sqlite":
+        # SQLite picks its own pool class (StaticPool for :memory:), which rejects sizing.
+        return options
+
+    options.update(
+        pool_size=_settings.db_pool_size,
+        max_overflow=_settings.db_max_overflow,
+        pool_timeout=_settings.db_pool_timeout,
+    )
+    if _settings.db_statement_timeout_ms is not None and url.get_backend_name() == "postgresql":
+        timeout = str(_settings.db_statement_timeout_ms)
+        if url.get_driver_name() == "asyncpg":
+            options["connect_args"] = {"server_settings": {"statement_timeout": timeout}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    return options
+
+
+def is_sqlite_high_throughput(_settings: Settings) -> bool:
+    url = make_url(_settings.database_url)
+    return (
+        _settings.db_sqlite_high_throughput
+        and url.get_backend_name() == "sqlite"
+        and url.database not in (None, "", ":memory:")
+    )
+
+
+def apply_sqlite_pragmas(sync_engine: Engine, _settings: Settings, read_only: bool = False) -> None:
+    pragmas = [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={_settings.db_sqlite_busy_timeout_ms}",
+        f"PRAGMA cache_size=-{_settings.db_sqlite_cache_size_kib}",
+        f"PRAGMA mmap_size={_settings.db_sqlite_mmap_size}",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
+
+    @event.listens_for(sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def violated_constraint(exc: IntegrityError) -> str | None:
+    """
+    Name of the constraint or unique index behind an IntegrityError, when the driver reports it.
+
+    psycopg exposes it on `diag` and asyncpg on the driver error SQLAlchemy wraps.
+    SQLite only names the columns in its message, so this returns None there.
+    """
+    for error in (exc.orig, getattr(exc.orig, "__cause__", None)):
+        name = getattr(error, "constraint_name", None) or getattr(getattr(error, "diag", None), "constraint_name", None)
+        if name:
+            return name
+    return None
+
+
+def create_engine(dsn: str, **options):
+    options.setdefault("echo", False)
+    return create_async_engine(dsn, **options)
+
+
+def create_read_replica_engine(_settings: Settings) -> AsyncEngine:
+    replica_settings = replace(_settings, db_dsn=_settings.db_read_dsn)
+    url = make_url(replica_settings.database_url)
+    read_engine = create_engine(replica_settings.database_url, **engine_options(replica_settings))
+    if url.get_backend_name() == "sqlite":
+        @event.listens_for(read_engine.sync_engine, "connect")
+        def _set_query_only(dbapi_connection, _connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA query_only=ON")
+            cursor.close()
+    elif url.get_backend_name() == "postgresql":
+        read_engine = read_engine.execution_options(postgresql_readonly=True)
+    return read_engine
+
+
+def create_engines(_settings: Settings) -> tuple[AsyncEngine, AsyncEngine | None]:
+    """
+    Build the write engine and, when reads have their own pool, the read engine.
+
+    With `db_read_dsn` set, reads go to that replica over read-only connections.
+    Otherwise, in the SQLite high-throughput profile every write session queues on a
+    single writer connection while reads use a separate pool of query-only connections.
+    """
+    options = engine_options(_settings)
+    if not is_sqlite_high_throughput(_settings):
+        write_engine = create_engine(_settings.database_url, **options)
+    else:
+        write_engine = create_engine(
+            _settings.database_url,
+            **options,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=_settings.db_pool_timeout,
+        )
+        apply_sqlite_pragmas(write_engine.sync_engine, _settings)
+
+    if _settings.db_read_dsn:
+        return write_engine, create_read_replica_engine(_settings)
+    if not is_sqlite_high_throughput(_settings):
+        return write_engine, None
+
+    read_engine = create_engine(
+        _settings.database_url,
+        **options,
+        pool_size=_settings.db_sqlite_read_pool_size,
+        max_overflow=0,
+        pool_timeout=_settings.db_pool_timeout,
     )
+    apply_sqlite_pragmas(read_engine.sync_engine, _settings, read_only=True)
+    return write_engine, read_engine
 
 
 def create_session(async_engine: AsyncEngine | None = None):
     if async_engine is None:
-        async_engine = create_engine(DSN)
+        async_engine = init_engine()
+
+    return async_sessionmaker(
+        async_engine,
+        expire_on_commit=False,
+        autoflush=False,
+        class_=AsyncSession,
+    )
+
 
+class ReadOnlySession(Session):
+    def flush(self, objects=None) -> None:
+        if self.new or self.dirty or self.deleted:
+            raise InvalidRequestError("Read sessions can't write; use DbSessionDep instead.")
+
+
+def create_read_session(async_engine: AsyncEngine):
+    """
+    Sessions for read-only endpoints. Flushing pending changes raises.
+
+    On SQLite, statements run on AUTOCOMMIT connections, so reads don't open, hold
+    and roll back a transaction around the request. PostgreSQL keeps a real
+    transaction: asyncpg only opens the server-side cursors behind
+    `session.stream()` inside one, and `postgresql_readonly` on the replica engine
+    is applied when it begins.
+    """
+    if async_engine.dialect.name == "sqlite":
+        async_engine = async_engine.execution_options(isolation_level="AUTOCOMMIT")
     return async_sessionmaker(
         async_engine,
         expire_on_commit=False,
         autoflush=False,
         class_=AsyncSession,
+        sync_session_class=ReadOnlySession,
     )
 
 
+engine: AsyncEngine | None = None
+read_engine: AsyncEngine | None = None
+
+async_session_factory: async_sessionmaker[AsyncSession] | None = None
+read_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def init_engine(_settings: Settings = settings) -> AsyncEngine:
+    global engine, read_engine, async_session_factory, read_session_factory
+    if engine is None:
+        engine, read_engine = create_engines(_settings)
+        async_session_factory = create_session(engine)
+        read_session_factory = create_read_session(read_engine or engine)
+    return engine
+
+
+async def dispose_engine() -> None:
+    global engine, read_engine, async_session_factory, read_session_factory
+    for _engine in (engine, read_engine):
+        if _engine is not None:
+            await _engine.dispose()
+    engine = None
+    read_engine = None
+    async_session_factory = None
+    read_session_factory = None
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    if async_session_factory is None:
+        init_engine()
+    return async_session_factory
+
+
+def get_read_session_factory() -> async_sessionmaker[AsyncSession]:
+    if read_session_factory is None:
+        init_engine()
+    return read_session_factory
+
+
 async def use_session():
-    async with async_session_factory() as session:
+    async with get_session_factory()() as session:
         yield session
 
-DSN = "sqlite+aiosqlite:///./local.db"
 
-engine = create_engine(DSN)
+async def use_read_session():
+    # Never committed: the session only reads, and anything left open is rolled back on close.
+    async with get_read_session_factory()() as session:
+        yield session
 
-async_session_factory = create_session(engine)
 
 DbSessionDep = Annotated[AsyncSession, Depends(use_session)]
+
+ReadSessionDep = Annotated[AsyncSession, Depends(use_read_session)]
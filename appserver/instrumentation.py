@@ -0,0 +1,163 @@
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryStats:
+    query_count: int = 0
+    total_time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: str | None = None
+    statement_counts: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.query_count += 1
+        self.total_time += duration
+        self.statement_counts[statement] += 1
+        if duration >= self.slowest_time:
+            self.slowest_time = duration
+            self.slowest_statement = statement
+
+    def repeated_statements(self, threshold: int) -> dict[str, int]:
+        return {
+            statement: count
+            for statement, count in self.statement_counts.items()
+            if count >= threshold
+        }
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    started_at = getattr(context, "_query_started_at", None)
+    if stats is not None and started_at is not None:
+        stats.record(statement, time.perf_counter() - started_at)
+
+
+def install_sql_instrumentation() -> None:
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@dataclass
+class RouteQueryReport:
+    requests: int = 0
+    queries: int = 0
+    db_time: float = 0.0
+    max_queries: int = 0
+    repeated_statement_requests: int = 0
+    slowest_time: float = 0.0
+    slowest_statement: str | None = None
+
+
+class QueryReport:
+    """
+    Per-route totals of the query stats recorded by `SQLInstrumentationMiddleware`.
+    """
+
+    def __init__(self):
+        self.routes: dict[str, RouteQueryReport] = {}
+
+    def record(self, route: str, stats: QueryStats, has_repeats: bool) -> None:
+        report = self.routes.setdefault(route, RouteQueryReport())
+        report.requests += 1
+        report.queries += stats.query_count
+        report.db_time += stats.total_time
+        report.max_queries = max(report.max_queries, stats.query_count)
+        report.repeated_statement_requests += int(has_repeats)
+        if stats.slowest_statement is not None and stats.slowest_time >= report.slowest_time:
+            report.slowest_time = stats.slowest_time
+            report.slowest_statement = stats.slowest_statement
+
+    def snapshot(self) -> dict[str, dict]:
+        return {
+            route: {
+                "requests": report.requests,
+                "avg_queries": report.queries / report.requests,
+                "max_queries": report.max_queries,
+                "avg_db_time_ms": report.db_time * 1000 / report.requests,
+                "repeated_statement_requests": report.repeated_statement_requests,
+                "slowest_ms": report.slowest_time * 1000,
+                "slowest_statement": report.slowest_statement,
+            }
+            for route, report in sorted(self.routes.items())
+        }
+
+    def clear(self) -> None:
+        self.routes.clear()
+
+
+query_report = QueryReport()
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class SQLInstrumentationMiddleware:
+    """
+    Counts the SQL statements each request runs.
+
+    Totals go into `query_report`, keyed by route template; requests that match no
+    route share one `<unmatched>` entry, so arbitrary URLs can't grow the report.
+    In debug mode they are also sent as `X-DB-*` response headers. A statement
+    repeated `repeat_threshold` times within one request is logged as a likely N+1
+    query.
+    """
+
+    def __init__(self, app: ASGIApp, debug: bool = False, repeat_threshold: int = 5):
+        self.app = app
+        self.debug = debug
+        self.repeat_threshold = repeat_threshold
+        install_sql_instrumentation()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            async def send_with_headers(message: Message) -> None:
+                if self.debug and message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Query-Count"] = str(stats.query_count)
+                    headers["X-DB-Time-Ms"] = f"{stats.total_time * 1000:.2f}"
+                    headers["X-DB-Slowest-Ms"] = f"{stats.slowest_time * 1000:.2f}"
+                await send(message)
+
+            await self.app(scope, receive, send_with_headers)
+
+        route = scope.get("route")
+        route_path = getattr(route, "path", UNMATCHED_ROUTE)
+        repeated = stats.repeated_statements(self.repeat_threshold)
+        for statement, count in repeated.items():
+            logger.warning("Possible N+1 on %s: %d x %s", route_path, count, statement)
+        query_report.record(f"{scope['method']} {route_path}", stats, bool(repeated))
@@ -0,0 +1,12 @@
+from appserver.settings import settings
+from .queue import Job, JobQueue
+
+
+job_queue = JobQueue(
+    durable=settings.jobs_durable,
+    max_queue_size=settings.jobs_max_queue_size,
+    retry_backoff=settings.jobs_retry_backoff_ms / 1000,
+    poll_interval=settings.jobs_poll_interval_ms / 1000,
+)
+
+__all__ = ["Job", "JobQueue", "job_queue"]
@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+
+from pydantic import AwareDatetime
+from sqlalchemy import Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy_utc import UtcDateTime
+from sqlmodel import SQLModel, Field, JSON, Text, func
+
+
+class OutboxJob(SQLModel, table=True):
+    __tablename__ = "job_outbox" # type: ignore[arg-type]
+    __table_args__ = (
+        Index("ix_job_outbox_available_at", "available_at"),
+    )
+
+    id: int = Field(default=None, primary_key=True)
+    name: str = Field(max_length=128)
+    payload: dict = Field(
+        sa_type=JSON().with_variant(JSONB(astext_type=Text()), "postgresql"),
+        description="Keyword arguments passed to the job handler",
+    )
+    attempts: int = Field(default=0)
+    available_at: AwareDatetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        sa_type=UtcDateTime,
+        description="Earliest time the job may run; pushed forward while a worker holds it",
+    )
+    failed_at: AwareDatetime | None = Field(
+        default=None,
+        nullable=True,
+        sa_type=UtcDateTime,
+        description="Set once retries are exhausted; failed jobs are kept for inspection",
+    )
+    last_error: str | None = Field(default=None, sa_type=Text)
+
+    created_at: AwareDatetime = Field(
+        default=None,
+        nullable=False,
+        sa_type=UtcDateTime,
+        sa_column_kwargs={
+            "server_default": func.now(),
+        },
+    )
@@ -0,0 +1,252 @@
+import asyncio
+import logging
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlmodel import delete, select, update
+
+from appserver.db import get_session_factory
+from .models import OutboxJob
+
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[..., Awaitable[None]]
+
+PENDING_JOBS_KEY = "pending_jobs"
+
+
+@dataclass
+class Job:
+    name: str
+    payload: dict
+    attempts: int = 0
+    outbox_id: int | None = None
+
+
+@dataclass
+class JobType:
+    handler: JobHandler
+    concurrency: int
+    max_retries: int
+    queue: asyncio.Queue | None = field(default=None, repr=False)
+
+
+def _open_session() -> AbstractAsyncContextManager[AsyncSession]:
+    return get_session_factory()()
+
+
+class JobQueue:
+    """
+    Runs side effects after the database commit, off the request path.
+
+    Each job type has its own bounded queue and `concurrency` worker tasks, and a
+    failed job is retried `max_retries` times with exponential backoff. Handlers are
+    called as `handler(session, **payload)` with a fresh session.
+
+    Jobs are staged on a session with `stage` and only submitted once that session
+    commits; a rollback discards them. In durable mode the staged job is written to
+    the `job_outbox` table in the same transaction instead, and a dispatcher feeds
+    outbox rows to the workers, so jobs survive a restart.
+    """
+
+    def __init__(
+            self,
+            session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]] = _open_session,
+            durable: bool = False,
+            max_queue_size: int = 1000,
+            retry_backoff: float = 1.0,
+            poll_interval: float = 1.0,
+            lease: float = 60.0,
+            batch_size: int = 100,
+    ):
+        self.session_factory = session_factory
+        self.durable = durable
+        self.max_queue_size = max_queue_size
+        self.retry_backoff = retry_backoff
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self.batch_size = batch_size
+        self.job_types: dict[str, JobType] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._retries: set[asyncio.Task] = set()
+        self._wakeup: asyncio.Event | None = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def register(self, name: str, handler: JobHandler, concurrency: int = 1, max_retries: int = 3) -> None:
+        self.job_types[name] = JobType(handler=handler, concurrency=concurrency, max_retries=max_retries)
+
+    def job(self, name: str, concurrency: int = 1, max_retries: int = 3) -> Callable[[JobHandler], JobHandler]:
+        def decorator(handler: JobHandler) -> JobHandler:
+            self.register(name, handler, concurrency=concurrency, max_retries=max_retries)
+            return handler
+        return decorator
+
+    def stage(self, session: AsyncSession, name: str, /, **payload) -> None:
+        if name not in self.job_types:
+            raise KeyError(f"Unknown job type: {name}")
+        if self.durable:
+            session.add(OutboxJob(name=name, payload=payload))
+        session.info.setdefault(PENDING_JOBS_KEY, []).append((self, Job(name=name, payload=payload)))
+
+    def submit(self, job: Job) -> None:
+        if not self.running:
+            logger.warning("Job queue is not running; dropped %s job", job.name)
+            return
+        if self.durable and job.outbox_id is None:
+            # Already in the outbox; the dispatcher picks it up.
+            self._wakeup.set()
+            return
+        try:
+            self.job_types[job.name].queue.put_nowait(job)
+        except asyncio.QueueFull:
+            logger.error("Job queue for %s is full; dropped job %r", job.name, job.payload)
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._wakeup = asyncio.Event()
+        for name, job_type in self.job_types.items():
+            job_type.queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._tasks.extend(
+                asyncio.create_task(self._work(job_type), name=f"job-worker-{name}-{n}")
+                for n in range(job_type.concurrency)
+            )
+        if self.durable:
+            self._tasks.append(asyncio.create_task(self._dispatch_outbox(), name="job-outbox-dispatcher"))
+
+    async def drain(self) -> None:
+        while True:
+            for job_type in self.job_types.values():
+                await job_type.queue.join()
+            if not self._retries:
+                return
+            await asyncio.gather(*self._retries, return_exceptions=True)
+
+    async def stop(self, timeout: float | None = None) -> None:
+        if not self.running:
+            return
+        try:
+            await asyncio.wait_for(self.drain(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Job queue did not drain within %s seconds", timeout)
+        for task in [*self._tasks, *self._retries]:
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._retries, return_exceptions=True)
+        self._tasks = []
+        self._retries = set()
+
+    async def _work(self, job_type: JobType) -> None:
+        while True:
+            job = await job_type.queue.get()
+            try:
+                await self._run(job_type, job)
+            finally:
+                job_type.queue.task_done()
+
+    async def _run(self, job_type: JobType, job: Job) -> None:
+        try:
+            async with self.session_factory() as session:
+                await job_type.handler(session, **job.payload)
+        except Exception as exc:
+            job.attempts += 1
+            exhausted = job.attempts > job_type.max_retries
+            delay = self.retry_backoff * 2 ** (job.attempts - 1)
+            if exhausted:
+                logger.exception("Job %s failed %d times; giving up", job.name, job.attempts)
+            else:
+                logger.warning("Job %s failed; retrying in %.1fs", job.name, delay)
+
+            if job.outbox_id is not None:
+                await self._record_failure(job, exc, exhausted, delay)
+            elif not exhausted:
+                task = asyncio.create_task(self._retry_later(job_type, job, delay))
+                self._retries.add(task)
+                task.add_done_callback(self._retries.discard)
+            return
+
+        if job.outbox_id is not None:
+            async with self.session_factory() as session:
+                await session.execute(delete(OutboxJob).where(OutboxJob.id == job.outbox_id))
+                await session.commit()
+
+    async def _retry_later(self, job_type: JobType, job: Job, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await job_type.queue.put(job)
+
+    async def _record_failure(self, job: Job, exc: Exception, exhausted: bool, delay: float) -> None:
+        now = datetime.now(timezone.utc)
+        values = {"attempts": job.attempts, "last_error": repr(exc)}
+        if exhausted:
+            values["failed_at"] = now
+        else:
+            values["available_at"] = now + timedelta(seconds=delay)
+        async with self.session_factory() as session:
+            await session.execute(update(OutboxJob).where(OutboxJob.id == job.outbox_id).values(**values))
+            await session.commit()
+
+    async def claim_outbox_jobs(self, session: AsyncSession) -> list[Job]:
+        """
+        Lease due outbox rows by pushing `available_at` past the lease, so a job whose
+        worker dies is picked up again once the lease runs out.
+        """
+        now = datetime.now(timezone.utc)
+        due = (
+            select(OutboxJob.id)
+            .where(OutboxJob.failed_at.is_(None))
+            .where(OutboxJob.available_at <= now)
+            .where(OutboxJob.name.in_(list(self.job_types)))
+            .order_by(OutboxJob.id)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(OutboxJob)
+            .where(OutboxJob.id.in_(due.scalar_subquery()))
+            .values(available_at=now + timedelta(seconds=self.lease))
+            .returning(OutboxJob.id, OutboxJob.name, OutboxJob.payload, OutboxJob.attempts)
+        )
+        result = await session.execute(stmt)
+        jobs = [
+            Job(name=row.name, payload=row.payload, attempts=row.attempts, outbox_id=row.id)
+            for row in result.all()
+        ]
+        await session.commit()
+        return sorted(jobs, key=lambda job: job.outbox_id)
+
+    async def _dispatch_outbox(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                async with self.session_factory() as session:
+                    jobs = await self.claim_outbox_jobs(session)
+                for job in jobs:
+                    await self.job_types[job.name].queue.put(job)
+            except Exception:
+                logger.exception("Failed to claim jobs from the outbox")
+                jobs = []
+            if len(jobs) < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+
+@event.listens_for(Session, "after_commit")
+def _submit_staged_jobs(session: Session) -> None:
+    for job_queue, job in session.info.pop(PENDING_JOBS_KEY, []):
+        job_queue.submit(job)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_staged_jobs(session: Session, previous_transaction) -> None:
+    # Rolling back a savepoint keeps jobs staged in the enclosing transaction.
+    if previous_transaction.parent is None:
+        session.info.pop(PENDING_JOBS_KEY, None)
@@ -0,0 +1,89 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class TTLCache:
+    """
+    Size-bounded LRU cache whose entries also expire after a time-to-live.
+
+    >>> now = [0.0]
+    >>> cache = TTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    >>> cache.set("a", 1)
+    >>> cache.set("b", 2, ttl=1)
+    >>> cache.get("a")
+    1
+    >>> cache.set("c", 3)  # evicts "b", the least recently used entry
+    >>> cache.get("b") is None
+    True
+    >>> now[0] = 11
+    >>> cache.get("a") is None  # expired
+    True
+    >>> cache.hits, cache.misses
+    (1, 2)
+    """
+
+    def __init__(
+            self,
+            maxsize: int,
+            ttl: float | None = None,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._lookup(key) is not None
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _lookup(self, key: Hashable) -> tuple[float | None, Any] | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at = entry[0]
+        if expires_at is not None and expires_at <= self.clock():
+            del self._data[key]
+            return None
+        return entry
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._lookup(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        if self.maxsize <= 0:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        if ttl is not None and ttl <= 0:
+            self._data.pop(key, None)
+            return
+        expires_at = None if ttl is None else self.clock() + ttl
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
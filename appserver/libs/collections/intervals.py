@@ -0,0 +1,61 @@
+from bisect import bisect_right
+from typing import Hashable, Iterable, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+def find_overlaps(intervals: Iterable[tuple[object, object, K]]) -> list[tuple[K, K]]:
+    """
+    Find overlapping half-open `(start, end, key)` intervals with a sweep over the sorted starts.
+
+    Each interval that overlaps an earlier-starting one is paired with the earlier
+    interval reaching furthest, so every interval involved in a conflict shows up in
+    at least one pair. Runs in O(n log n).
+
+    >>> find_overlaps([(9, 10, "a"), (10, 11, "b"), (10, 12, "c"), (11, 13, "d")])
+    [('b', 'c'), ('c', 'd')]
+    >>> find_overlaps([(1, 2, "a"), (2, 3, "b")])
+    []
+    """
+    overlaps = []
+    furthest_end = None
+    furthest_key = None
+    for start, end, key in sorted(intervals, key=lambda interval: (interval[0], interval[1])):
+        if furthest_end is not None and start < furthest_end:
+            overlaps.append((furthest_key, key))
+        if furthest_end is None or end > furthest_end:
+            furthest_end = end
+            furthest_key = key
+    return overlaps
+
+
+def merge_intervals(intervals: Iterable[tuple[T, T]]) -> list[tuple[T, T]]:
+    """
+    Merge overlapping or touching `(start, end)` intervals into a sorted, disjoint list.
+
+    >>> merge_intervals([(5, 7), (1, 3), (2, 4), (7, 8)])
+    [(1, 4), (5, 8)]
+    """
+    merged: list[tuple[T, T]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def overlaps_any(merged: list[tuple[T, T]], start: T, end: T) -> bool:
+    """
+    Tell whether `[start, end)` overlaps one of the intervals returned by `merge_intervals`.
+
+    >>> busy = merge_intervals([(9, 10), (13, 15)])
+    >>> overlaps_any(busy, 10, 11), overlaps_any(busy, 14, 16), overlaps_any(busy, 8, 9)
+    (False, True, False)
+    """
+    # Ends are increasing in a merged list; find the first interval ending after `start`.
+    index = bisect_right(merged, start, key=lambda interval: interval[1])
+    return index < len(merged) and merged[index][0] < end
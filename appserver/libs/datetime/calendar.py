@@ -1,4 +1,5 @@
 from datetime import date, timedelta
+from functools import lru_cache
 
 
 def get_start_weekday_of_month(year, month):
@@ -52,27 +53,34 @@ def get_range_days_of_month(year, month):
     >>> len(result)
     33
     """
+    return list(_get_month_grid(year, month))
 
-    # Get the starting weekday (0=Monday, 6=Sunday)
-    start_weekday = get_start_weekday_of_month(year, month)
 
-    # Get the last day of the month
-    last_day = get_last_day_of_month(year, month)
+@lru_cache(maxsize=1024)
+def _get_month_grid(year, month) -> tuple[int, ...]:
+    # Get the starting weekday, adjusted to make Sunday=0, Saturday=6
+    start_weekday = (get_start_weekday_of_month(year, month) + 1) % 7
 
-    # Adjust to make Sunday=0, Saturday=6
-    start_weekday = (start_weekday + 1) % 7
+    # Leading zeros align the first day under its weekday column
+    return (0,) * start_weekday + tuple(range(1, get_last_day_of_month(year, month) + 1))
 
-    # Prepare the result list with leading zeros for alignment
-    result = [0] * start_weekday # fill leading days with 0 before the first day of the month
 
-    # Append the days of the month
-    # for day in range(1, last_day + 1):
-    #   result.append(day)
-
-    return result + list(range(1, last_day + 1))
+def get_range_days_of_months(year, month, count):
+    """
+    Get the padded day grids of `count` consecutive months starting at year/month.
 
+    >>> grids = get_range_days_of_months(2024, 12, 3)
+    >>> [len(grid) for grid in grids]
+    [31, 34, 34]
+    >>> grids[1][:3], grids[1][3]
+    ([0, 0, 0], 1)
+    """
+    grids = []
+    for offset in range(count):
+        index = year * 12 + (month - 1) + offset
+        grids.append(list(_get_month_grid(index // 12, index % 12 + 1)))
+    return grids
 
-from datetime import date, timedelta
 
 def get_next_weekday(weekday: int, start_date: date = None) -> date:
     """
@@ -105,3 +113,66 @@ def get_next_weekday(weekday: int, start_date: date = None) -> date:
         return start_date
     else:
         return start_date + timedelta(days=days_ahead)
+
+
+def weekdays_to_mask(weekdays) -> int:
+    """
+    Encode weekdays (0=Monday, 6=Sunday) as a bitmask where bit N is weekday N.
+
+    >>> weekdays_to_mask([0, 2, 2])
+    5
+    >>> weekdays_to_mask([])
+    0
+    """
+    mask = 0
+    for weekday in weekdays:
+        mask |= 1 << weekday
+    return mask
+
+
+def mask_to_weekdays(mask: int) -> list[int]:
+    """
+    Decode a weekday bitmask back into sorted weekdays.
+
+    >>> mask_to_weekdays(5)
+    [0, 2]
+    """
+    return [weekday for weekday in range(7) if mask >> weekday & 1]
+
+
+@lru_cache(maxsize=7 * 128)
+def _weekday_offsets(mask: int, start_weekday: int) -> tuple[int, ...]:
+    # Days after a week's first date on which each target weekday falls, ascending.
+    return tuple(sorted((weekday - start_weekday) % 7 for weekday in mask_to_weekdays(mask)))
+
+
+def get_weekday_dates_in_range(weekdays, start_date: date, end_date: date) -> list[date]:
+    """
+    Returns every date between start_date and end_date (both inclusive)
+    whose weekday is in the given weekdays, in ascending order.
+
+    Works on date ordinals: each week of the range contributes the
+    precomputed offsets of the target weekdays, so no sorting is needed.
+
+    :param weekdays: Target weekdays (0=Monday, 6=Sunday)
+    :param start_date: First date of the range
+    :param end_date: Last date of the range
+    :return: Matching dates in ascending order
+
+    >>> import calendar
+    >>> from datetime import date
+    >>> get_weekday_dates_in_range([calendar.TUESDAY, calendar.MONDAY], date(2024, 12, 1), date(2024, 12, 10))
+    [datetime.date(2024, 12, 2), datetime.date(2024, 12, 3), datetime.date(2024, 12, 9), datetime.date(2024, 12, 10)]
+    >>> get_weekday_dates_in_range([calendar.MONDAY], date(2024, 12, 3), date(2024, 12, 8))
+    []
+    """
+    offsets = _weekday_offsets(weekdays_to_mask(weekdays), start_date.weekday())
+    first = start_date.toordinal()
+    last = end_date.toordinal()
+    fromordinal = date.fromordinal
+    return [
+        fromordinal(week + offset)
+        for week in range(first, last + 1, 7)
+        for offset in offsets
+        if week + offset <= last
+    ]
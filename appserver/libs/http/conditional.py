@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+
+def make_etag(*parts) -> str:
+    """
+    Build a weak entity tag from the parts that identify a representation.
+
+    >>> make_etag(1, 1767225600, "public")
+    'W/"1-1767225600-public"'
+    """
+    return 'W/"' + "-".join(str(part) for part in parts) + '"'
+
+
+def format_http_date(value: datetime) -> str:
+    """
+    >>> format_http_date(datetime(2026, 1, 10, 9, 30, 15, 123, tzinfo=timezone.utc))
+    'Sat, 10 Jan 2026 09:30:15 GMT'
+    """
+    return format_datetime(value.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+def _opaque_tag(etag: str) -> str:
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def is_not_modified(
+        etag: str,
+        last_modified: datetime | None,
+        if_none_match: str | None,
+        if_modified_since: str | None,
+) -> bool:
+    """
+    Evaluate conditional GET headers; `If-None-Match` takes precedence over `If-Modified-Since`.
+
+    >>> updated_at = datetime(2026, 1, 10, 9, 30, 15, 500, tzinfo=timezone.utc)
+    >>> is_not_modified('W/"a"', updated_at, '"b", W/"a"', None)
+    True
+    >>> is_not_modified('W/"a"', updated_at, '"b"', "Sat, 10 Jan 2026 09:30:15 GMT")
+    False
+    >>> is_not_modified('W/"a"', updated_at, None, "Sat, 10 Jan 2026 09:30:15 GMT")
+    True
+    >>> is_not_modified('W/"a"', updated_at, None, "Sat, 10 Jan 2026 09:30:14 GMT")
+    False
+    >>> is_not_modified('W/"a"', updated_at, None, "not a date")
+    False
+    """
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        tag = _opaque_tag(etag)
+        return any(_opaque_tag(candidate) == tag for candidate in if_none_match.split(","))
+
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
@@ -0,0 +1,34 @@
+import base64
+import json
+
+
+def encode_cursor(*values: str | int) -> str:
+    """
+    Pack the sort key of the last row of a page into an opaque URL-safe cursor.
+
+    >>> encode_cursor("2026-01-06", 42)
+    'WyIyMDI2LTAxLTA2Iiw0Ml0'
+    >>> decode_cursor(encode_cursor("2026-01-06", 42))
+    ['2026-01-06', 42]
+    """
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> list:
+    """
+    Unpack a cursor made by `encode_cursor`, raising `ValueError` if it is malformed.
+
+    >>> decode_cursor("not-a-cursor")
+    Traceback (most recent call last):
+    ...
+    ValueError: Invalid cursor.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor.") from exc
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor.")
+    return values
@@ -0,0 +1,62 @@
+from datetime import date, datetime, time, timezone
+
+
+def escape_text(value: str) -> str:
+    r"""
+    Escape a TEXT property value (RFC 5545 section 3.3.11).
+
+    >>> escape_text("Coffee; chat, maybe\nlater \\ soon")
+    'Coffee\\; chat\\, maybe\\nlater \\\\ soon'
+    """
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str, limit: int = 75) -> str:
+    """
+    Fold a content line into CRLF-terminated lines of at most `limit` octets.
+
+    >>> fold_line("SUMMARY:" + "a" * 70)
+    'SUMMARY:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa\\r\\n aaa\\r\\n'
+    >>> fold_line("SUMMARY:커피")
+    'SUMMARY:커피\\r\\n'
+    """
+    encoded = line.encode()
+    if len(encoded) <= limit:
+        return line + "\r\n"
+
+    parts = []
+    start = 0
+    width = limit
+    while start < len(encoded):
+        end = min(start + width, len(encoded))
+        # Never split a multi-byte UTF-8 sequence.
+        while end < len(encoded) and (encoded[end] & 0xC0) == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode())
+        start = end
+        width = limit - 1
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def format_utc(value: datetime) -> str:
+    """
+    >>> format_utc(datetime(2026, 1, 6, 9, 30, tzinfo=timezone.utc))
+    '20260106T093000Z'
+    """
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def format_floating(day: date, at: time) -> str:
+    """
+    Format a local date-time without a time zone ("floating" time).
+
+    >>> format_floating(date(2026, 1, 6), time(9, 30))
+    '20260106T093000'
+    """
+    return datetime.combine(day, at).strftime("%Y%m%dT%H%M%S")
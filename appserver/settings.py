@@ -0,0 +1,100 @@
+import os
+from dataclasses import dataclass, fields
+from typing import Mapping
+
+
+ENV_PREFIX = "APPSERVER_"
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _parse_optional_int(value: str) -> int | None:
+    return int(value) if value.strip() else None
+
+
+_PARSERS = {
+    bool: _parse_bool,
+    int: int,
+    str: str,
+    int | None: _parse_optional_int,
+    str | None: lambda value: value or None,
+}
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Deployment settings read from `APPSERVER_*` environment variables.
+
+    >>> settings = Settings.from_env({"APPSERVER_DB_POOL_SIZE": "20", "APPSERVER_DB_ECHO": "true"})
+    >>> settings.db_pool_size, settings.db_echo
+    (20, True)
+    >>> Settings(db_dsn="postgresql://app@db/coffee").database_url
+    'postgresql+asyncpg://app@db/coffee'
+    """
+
+    debug: bool = False
+    sql_repeat_threshold: int = 5
+
+    calendar_page_cache_enabled: bool = True
+    calendar_page_cache_size: int = 4096
+    calendar_page_cache_ttl_seconds: int = 300
+    calendar_feed_event_cache_size: int = 50_000
+    calendar_free_busy_cache_size: int = 4096
+    calendar_free_busy_ttl_seconds: int = 900
+
+    booking_hold_backend: str = "memory"
+    booking_hold_ttl_seconds: int = 120
+    booking_hold_max_per_guest: int = 3
+    booking_hold_max_size: int = 100_000
+
+    calendar_sync_backend: str | None = None
+    calendar_sync_batch_size: int = 50
+    calendar_sync_max_concurrency: int = 4
+    calendar_sync_max_retries: int = 5
+    calendar_sync_retry_backoff_ms: int = 500
+    calendar_sync_pull_interval_seconds: int = 300
+    calendar_sync_pull_days: int = 28
+
+    jobs_durable: bool = False
+    jobs_max_queue_size: int = 1000
+    jobs_retry_backoff_ms: int = 1000
+    jobs_poll_interval_ms: int = 1000
+    jobs_shutdown_timeout_seconds: int = 10
+
+    db_dsn: str = "sqlite+aiosqlite:///./local.db"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_timeout_ms: int | None = None
+    db_echo: bool = False
+    db_read_dsn: str | None = None
+    db_sqlite_high_throughput: bool = False
+    db_sqlite_read_pool_size: int = 4
+    db_sqlite_busy_timeout_ms: int = 5000
+    db_sqlite_cache_size_kib: int = 65536
+    db_sqlite_mmap_size: int = 268435456
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> "Settings":
+        values = {}
+        for field in fields(cls):
+            raw = environ.get(f"{ENV_PREFIX}{field.name.upper()}")
+            if raw is not None:
+                values[field.name] = _PARSERS[field.type](raw)
+        return cls(**values)
+
+    @property
+    def database_url(self) -> str:
+        # Plain PostgreSQL URLs default to the asyncpg driver.
+        for scheme in ("postgres://", "postgresql://"):
+            if self.db_dsn.startswith(scheme):
+                return "postgresql+asyncpg://" + self.db_dsn[len(scheme):]
+        return self.db_dsn
+
+
+settings = Settings.from_env()
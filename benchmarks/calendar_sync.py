@@ -0,0 +1,94 @@
+"""
+Push throughput of the calendar sync worker against the fake backend with simulated latency.
+
+    python -m benchmarks.calendar_sync --hosts 20 --bookings 2000 --latency-ms 50
+"""
+import argparse
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import date, time as time_of_day, timedelta
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot
+from appserver.apps.calendar.providers import FakeCalendarProvider
+from appserver.apps.calendar.sync import CalendarSyncWorker
+from appserver.db import create_session
+
+
+async def _seed(session_factory, hosts: int, bookings: int) -> list[int]:
+    async with session_factory() as session:
+        guest = User(username="guest", email="guest@example.com", display_name="guest", hashed_password="x")
+        session.add(guest)
+        time_slots = []
+        for n in range(hosts):
+            host = User(username=f"host{n}", email=f"host{n}@example.com", display_name="host", hashed_password="x", is_host=True)
+            calendar = Calendar(host=host, topics=["bench"], description="benchmark host", google_calendar_id=f"host{n}@example.com")
+            time_slot = TimeSlot(calendar=calendar, start_time=time_of_day(9), end_time=time_of_day(10), weekdays=list(range(7)))
+            session.add(time_slot)
+            time_slots.append(time_slot)
+        await session.flush()
+
+        rows = [
+            Booking(
+                when=date.today() + timedelta(days=n // hosts),
+                topic="bench",
+                description="bench",
+                time_slot_id=time_slots[n % hosts].id,
+                guest_id=guest.id,
+            )
+            for n in range(bookings)
+        ]
+        session.add_all(rows)
+        await session.commit()
+        return [row.id for row in rows]
+
+
+async def run(hosts: int, bookings: int, latency: float, batch_size: int, concurrency: int) -> float:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_factory = create_session(engine)
+    booking_ids = await _seed(session_factory, hosts, bookings)
+
+    @asynccontextmanager
+    async def open_session():
+        async with session_factory() as session:
+            yield session
+
+    worker = CalendarSyncWorker(
+        FakeCalendarProvider(latency=latency),
+        session_factory=open_session,
+        batch_size=batch_size,
+        max_concurrency=concurrency,
+        pull_interval=3600,
+    )
+    worker.start()
+    started = time.perf_counter()
+    for booking_id in booking_ids:
+        worker.enqueue_booking(booking_id)
+    await worker.drain()
+    elapsed = time.perf_counter() - started
+    await worker.stop()
+    await engine.dispose()
+    return bookings / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hosts", type=int, default=20)
+    parser.add_argument("--bookings", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--batch-size", type=int, default=50)
+    args = parser.parse_args()
+
+    for concurrency in (1, 4, 16):
+        result = await run(args.hosts, args.bookings, args.latency_ms / 1000, args.batch_size, concurrency)
+        print(f"concurrency {concurrency:>2}: {result:8.1f} bookings/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
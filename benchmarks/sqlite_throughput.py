@@ -0,0 +1,92 @@
+"""
+Concurrent read/write throughput of the SQLite deployment, default vs high-throughput profile.
+
+    python -m benchmarks.sqlite_throughput --writers 8 --readers 32 --seconds 5
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from dataclasses import replace
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import SQLModel
+
+from appserver.apps.account import models as account_models  # noqa
+from appserver.apps.calendar import models as calendar_models  # noqa
+from appserver.db import create_engines
+from appserver.settings import Settings
+
+
+async def _writer(engine: AsyncEngine, worker: int, deadline: float, counts: dict) -> None:
+    n = 0
+    while time.perf_counter() < deadline:
+        n += 1
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(
+                    text(
+                        "INSERT INTO users (username, email, display_name, hashed_password, is_host) "
+                        "VALUES (:username, :email, 'bench user', 'x' || hex(randomblob(8)), 0)"
+                    ),
+                    {"username": f"w{worker}-{n}", "email": f"w{worker}-{n}@example.com"},
+                )
+            counts["writes"] += 1
+        except OperationalError:
+            counts["errors"] += 1
+
+
+async def _reader(engine: AsyncEngine, deadline: float, counts: dict) -> None:
+    while time.perf_counter() < deadline:
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT count(*) FROM users WHERE is_host = 0"))
+            counts["reads"] += 1
+        except OperationalError:
+            counts["errors"] += 1
+
+
+async def run(settings: Settings, writers: int, readers: int, seconds: float) -> dict:
+    write_engine, read_engine = create_engines(settings)
+    read_engine = read_engine or write_engine
+    async with write_engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    counts = {"writes": 0, "reads": 0, "errors": 0}
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(
+        *(_writer(write_engine, i, deadline, counts) for i in range(writers)),
+        *(_reader(read_engine, deadline, counts) for _ in range(readers)),
+    )
+    for engine in {write_engine, read_engine}:
+        await engine.dispose()
+    return {key: value / seconds if key != "errors" else value for key, value in counts.items()}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, high_throughput in (("default", False), ("high-throughput", True)):
+            path = os.path.join(tmp, f"{name}.db")
+            settings = replace(
+                Settings(),
+                db_dsn=f"sqlite+aiosqlite:///{path}",
+                db_sqlite_high_throughput=high_throughput,
+            )
+            result = await run(settings, args.writers, args.readers, args.seconds)
+            print(
+                f"{name:>16}: {result['writes']:8.1f} writes/s "
+                f"{result['reads']:8.1f} reads/s {result['errors']:5d} errors"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
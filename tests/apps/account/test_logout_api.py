@@ -1,5 +1,6 @@
 from fastapi.testclient import TestClient
 from fastapi import status
+from appserver.apps.account.cache import token_cache, token_digest
 from appserver.apps.account.constants import AUTH_TOKEN_COOKIE_NAME
 from appserver.apps.account.models import User
 
@@ -9,4 +10,26 @@ async def test_auth_token_must_be_removed_when_logout(client_with_auth: TestClie
     assert response.status_code == status.HTTP_200_OK
 
     assert response.cookies.get(AUTH_TOKEN_COOKIE_NAME) is None
-    
\ No newline at end of file
+
+
+async def test_cached_token_is_invalidated_when_logout(client_with_auth: TestClient):
+    token = client_with_auth.cookies.get(AUTH_TOKEN_COOKIE_NAME, domain="", path="/")
+    client_with_auth.get("/account/@me")
+    assert token_digest(token) in token_cache
+
+    response = client_with_auth.delete("/account/logout")
+    assert response.status_code == status.HTTP_200_OK
+
+    assert token_digest(token) not in token_cache
+
+
+async def test_token_is_rejected_after_logout(client_with_auth: TestClient):
+    token = client_with_auth.cookies.get(AUTH_TOKEN_COOKIE_NAME, domain="", path="/")
+
+    response = client_with_auth.delete("/account/logout")
+    assert response.status_code == status.HTTP_200_OK
+
+    client_with_auth.cookies.clear()
+    client_with_auth.cookies[AUTH_TOKEN_COOKIE_NAME] = token
+    response = client_with_auth.get("/account/@me")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
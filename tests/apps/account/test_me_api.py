@@ -2,7 +2,12 @@ from fastapi import status
 from fastapi.testclient import TestClient
 from appserver.apps.account.models import User
 from appserver.apps.account.utils import decode_token, create_access_token
+from sqlalchemy import inspect
+from appserver.apps.account.cache import token_cache, token_digest, user_cache
 from datetime import datetime, timedelta, timezone
+from dataclasses import replace
+import pytest
+from appserver.apps.account import deps
 
 
 def test_get_my_info(client_with_auth: TestClient, host_user: User):
@@ -47,3 +52,51 @@ def test_get_my_info_when_user_not_exists(client_with_auth: TestClient):
 
     response = client_with_auth.get("/account/@me")
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_decoded_token_is_cached_between_requests(client_with_auth: TestClient):
+    token = client_with_auth.cookies.get("auth_token", domain="", path="/")
+
+    client_with_auth.get("/account/@me")
+    client_with_auth.get("/account/@me")
+
+    assert token_digest(token) in token_cache
+    assert token_cache.misses == 1
+    assert token_cache.hits == 1
+
+
+def test_current_user_is_served_from_cache_as_a_copy(client_with_auth: TestClient, host_user: User):
+    client_with_auth.get("/account/@me")
+    snapshot = user_cache.get(host_user.username)
+    assert snapshot is not None
+    assert inspect(snapshot).detached
+
+    response = client_with_auth.get("/account/@me")
+    assert response.status_code == status.HTTP_200_OK
+    assert user_cache.hits == 2
+    assert inspect(snapshot).detached
+
+
+def test_user_cache_is_invalidated_when_user_is_updated(client_with_auth: TestClient, host_user: User):
+    client_with_auth.get("/account/@me")
+    assert host_user.username in user_cache
+
+    response = client_with_auth.patch("/account/@me", json={"display_name": "zipsanewname"})
+    assert response.status_code == status.HTTP_200_OK
+    assert host_user.username not in user_cache
+
+    response = client_with_auth.get("/account/@me")
+    assert response.json()["display_name"] == "zipsanewname"
+
+
+def test_user_read_from_a_replica_is_not_cached(
+    client_with_auth: TestClient,
+    host_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(deps, "settings", replace(deps.settings, db_read_dsn="postgresql://app@replica/coffee"))
+
+    response = client_with_auth.get("/account/@me")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert host_user.username not in user_cache
@@ -0,0 +1,49 @@
+import asyncio
+import threading
+import pytest
+from appserver.apps.account.exceptions import PasswordHashingBusyError
+from appserver.apps.account.hashing import PasswordHashingEngine
+from appserver.apps.account.utils import hash_password_async, verify_password_async
+
+
+class BlockingHasher:
+    def __init__(self):
+        self.released = threading.Event()
+
+    def hash(self, password: str) -> str:
+        self.released.wait(timeout=5)
+        return f"hashed:{password}"
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        self.released.wait(timeout=5)
+        return hashed_password == f"hashed:{password}"
+
+
+async def test_hash_and_verify_password_off_the_event_loop():
+    hashed = await hash_password_async("testtest")
+
+    assert hashed != "testtest"
+    assert await verify_password_async("testtest", hashed) is True
+    assert await verify_password_async("wrong_password", hashed) is False
+
+
+async def test_reject_immediately_when_queue_is_full():
+    hasher = BlockingHasher()
+    engine = PasswordHashingEngine(hasher, max_workers=1, max_queue_size=1)
+
+    running = asyncio.create_task(engine.hash("first"))
+    queued = asyncio.create_task(engine.hash("second"))
+    await asyncio.sleep(0)
+    assert engine.in_flight == 2
+    assert engine.queue_depth == 1
+
+    with pytest.raises(PasswordHashingBusyError):
+        await engine.hash("third")
+
+    hasher.released.set()
+    assert await running == "hashed:first"
+    assert await queued == "hashed:second"
+    assert engine.in_flight == 0
+
+    assert await engine.verify("third", "hashed:third") is True
+    engine.shutdown()
@@ -0,0 +1,40 @@
+import pytest
+from fastapi.testclient import TestClient
+from appserver.apps.account.cache import TokenRevocationList
+from appserver.apps.account.deps import get_principal
+from appserver.apps.account.exceptions import InvalidTokenError
+from appserver.apps.account.models import User
+
+
+def test_principal_is_built_from_token_claims(client_with_auth: TestClient, host_user: User):
+    token = client_with_auth.cookies.get("auth_token", domain="", path="/")
+
+    principal = get_principal(token)
+
+    assert principal.username == host_user.username
+    assert principal.display_name == host_user.display_name
+    assert principal.is_host is True
+    assert principal.token_id is not None
+
+
+def test_principal_is_rejected_once_token_is_revoked(client_with_auth: TestClient):
+    token = client_with_auth.cookies.get("auth_token", domain="", path="/")
+
+    client_with_auth.delete("/account/logout")
+
+    with pytest.raises(InvalidTokenError):
+        get_principal(token)
+
+
+def test_revoked_token_id_outlives_token_lifetime_then_expires():
+    now = [0.0]
+    revoked = TokenRevocationList(capacity=100, lifetime=10, clock=lambda: now[0])
+
+    now[0] = 9
+    revoked.revoke("jti-1")
+
+    now[0] = 18
+    assert revoked.is_revoked("jti-1")
+
+    now[0] = 30
+    assert not revoked.is_revoked("jti-1")
@@ -1,7 +1,9 @@
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
 from fastapi.testclient import TestClient
 from fastapi import status
 from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Calendar, TimeSlot
 
 
 async def test_user_is_deleted_when_unregister(client_with_auth: TestClient, host_user: User, db_session: AsyncSession,):
@@ -13,4 +15,18 @@ async def test_user_is_deleted_when_unregister(client_with_auth: TestClient, hos
 
     assert response.status_code == status.HTTP_204_NO_CONTENT
     assert await db_session.get(User, user_id) is None
-    
\ No newline at end of file
+    
+
+async def test_host_calendar_is_deleted_with_the_user(
+    client_with_auth: TestClient,
+    host_user: User,
+    time_slot_tuesday: TimeSlot,
+    db_session: AsyncSession,
+):
+    response = client_with_auth.delete("/account/unregister")
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    result = await db_session.execute(select(Calendar).where(Calendar.host_id == host_user.id))
+    assert result.scalar_one_or_none() is None
+    result = await db_session.execute(select(TimeSlot).where(TimeSlot.id == time_slot_tuesday.id))
+    assert result.scalar_one_or_none() is None
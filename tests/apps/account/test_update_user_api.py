@@ -2,6 +2,7 @@ import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 from appserver.apps.account.models import User
+from appserver.apps.account.utils import password_hashing_engine
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -121,3 +122,28 @@ async def test_reject_update_without_authentication(
         status.HTTP_422_UNPROCESSABLE_CONTENT,
         status.HTTP_401_UNAUTHORIZED
     ]
+
+
+async def test_password_is_hashed_exactly_once_per_update(
+    client_with_auth: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    hasher = password_hashing_engine.hasher
+    original_hash = hasher.hash
+    calls = []
+
+    def counting_hash(password: str) -> str:
+        calls.append(password)
+        return original_hash(password)
+
+    monkeypatch.setattr(hasher, "hash", counting_hash)
+
+    payload = {
+        "display_name": "zipsanewname",
+        "password": "new_password",
+        "password_again": "new_password",
+    }
+
+    response = client_with_auth.patch("/account/@me", json=payload)
+    assert response.status_code == status.HTTP_200_OK
+    assert calls == ["new_password"]
@@ -0,0 +1,117 @@
+import calendar
+from datetime import date, time, timedelta
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot
+from appserver.libs.datetime.calendar import get_next_weekday
+
+
+@pytest.fixture()
+async def time_slot_monday_thursday(
+    db_session: AsyncSession,
+    host_user_calendar: Calendar,
+):
+    time_slot = TimeSlot(
+        start_time=time(14, 0),
+        end_time=time(15, 0),
+        weekdays=[calendar.MONDAY, calendar.THURSDAY],
+        calendar_id=host_user_calendar.id,
+    )
+    db_session.add(time_slot)
+    await db_session.commit()
+    return time_slot
+
+
+async def test_availability_expands_weekdays_over_range(
+    client: TestClient,
+    host_user: User,
+    time_slot_tuesday: TimeSlot,
+    time_slot_monday_thursday: TimeSlot,
+):
+    start = get_next_weekday(calendar.MONDAY) + timedelta(days=7)
+    end = start + timedelta(days=13)
+
+    response = client.get(
+        f"/calendar/{host_user.username}/availability",
+        params={"from": start.isoformat(), "to": end.isoformat()},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [(item["when"], item["time_slot_id"]) for item in data] == [
+        (start.isoformat(), time_slot_monday_thursday.id),
+        ((start + timedelta(days=1)).isoformat(), time_slot_tuesday.id),
+        ((start + timedelta(days=3)).isoformat(), time_slot_monday_thursday.id),
+        ((start + timedelta(days=7)).isoformat(), time_slot_monday_thursday.id),
+        ((start + timedelta(days=8)).isoformat(), time_slot_tuesday.id),
+        ((start + timedelta(days=10)).isoformat(), time_slot_monday_thursday.id),
+    ]
+    assert data[1]["start_time"] == time_slot_tuesday.start_time.isoformat()
+
+
+async def test_availability_excludes_booked_occurrences(
+    client: TestClient,
+    db_session: AsyncSession,
+    host_user: User,
+    guest_user: User,
+    time_slot_tuesday: TimeSlot,
+):
+    first_tuesday = get_next_weekday(calendar.TUESDAY) + timedelta(days=7)
+    db_session.add(Booking(
+        when=first_tuesday,
+        topic="test",
+        description="test",
+        time_slot_id=time_slot_tuesday.id,
+        guest_id=guest_user.id,
+    ))
+    await db_session.commit()
+
+    response = client.get(
+        f"/calendar/{host_user.username}/availability",
+        params={"from": first_tuesday.isoformat(), "to": (first_tuesday + timedelta(days=7)).isoformat()},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["when"] for item in response.json()] == [(first_tuesday + timedelta(days=7)).isoformat()]
+
+
+async def test_availability_never_returns_past_dates(
+    client: TestClient,
+    host_user: User,
+    time_slot_tuesday: TimeSlot,
+):
+    response = client.get(
+        f"/calendar/{host_user.username}/availability",
+        params={"from": date(2020, 1, 1).isoformat()},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data
+    assert data[0]["when"] == get_next_weekday(calendar.TUESDAY).isoformat()
+
+
+@pytest.mark.parametrize("days", [-1, 366])
+async def test_availability_rejects_invalid_range(
+    client: TestClient,
+    host_user: User,
+    host_user_calendar: Calendar,
+    days: int,
+):
+    start = date.today() + timedelta(days=1)
+    response = client.get(
+        f"/calendar/{host_user.username}/availability",
+        params={"from": start.isoformat(), "to": (start + timedelta(days=days)).isoformat()},
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_availability_of_guest_user_returns_404(client: TestClient, guest_user: User):
+    response = client.get(f"/calendar/{guest_user.username}/availability")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
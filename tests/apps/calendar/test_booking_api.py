@@ -1,12 +1,17 @@
 import calendar
+import sqlite3
 from datetime import date, timedelta
 import pytest
 
-from fastapi import status
+from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError
 
 from appserver.apps.account.models import User
+from appserver.apps.account.utils import create_access_token
+from appserver.apps.calendar.endpoints import _is_duplicate_booking
 from appserver.apps.calendar.models import TimeSlot
+from appserver.instrumentation import SQLInstrumentationMiddleware
 from appserver.libs.datetime.calendar import get_next_weekday
 
 
@@ -129,3 +134,72 @@ async def test_duplicate_booking_request_returns_http_422(
         json=valid_booking_payload,
     )
     assert reponse.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_another_guest_cannot_book_an_occupied_time_slot(
+        host_user: User,
+        cute_guest_user: User,
+        client_with_guest_auth: TestClient,
+        fastapi_app: FastAPI,
+        valid_booking_payload: dict,
+):
+    response = client_with_guest_auth.post(
+        f"/bookings/{host_user.username}",
+        json=valid_booking_payload,
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    with TestClient(fastapi_app) as client:
+        client.cookies.set("auth_token", create_access_token({"sub": cute_guest_user.username}))
+
+        next_week = get_next_weekday(calendar.TUESDAY) + timedelta(days=7)
+        response = client.post(
+            f"/bookings/{host_user.username}",
+            json={**valid_booking_payload, "when": next_week.isoformat()},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        response = client.post(
+            f"/bookings/{host_user.username}",
+            json=valid_booking_payload,
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_create_booking_builds_response_without_extra_queries(
+        host_user: User,
+        guest_user: User,
+        fastapi_app: FastAPI,
+        valid_booking_payload: dict,
+):
+    fastapi_app.add_middleware(SQLInstrumentationMiddleware, debug=True)
+
+    with TestClient(fastapi_app) as client:
+        client.cookies.set("auth_token", create_access_token({"sub": guest_user.username}))
+        # Warm the user cache so only the booking path is counted.
+        client.get("/account/@me")
+        response = client.post(
+            f"/bookings/{host_user.username}",
+            json=valid_booking_payload,
+        )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["time_slot"]["start_time"] == "09:00:00"
+    # Host with calendar, time slot, INSERT ... RETURNING.
+    assert response.headers["X-DB-Query-Count"] == "3"
+
+
+class FakeConstraintError(Exception):
+    def __init__(self, constraint_name: str):
+        self.constraint_name = constraint_name
+
+
+@pytest.mark.parametrize("orig, expected", [
+    (sqlite3.IntegrityError("UNIQUE constraint failed: bookings.time_slot_id, bookings.when"), True),
+    (sqlite3.IntegrityError("NOT NULL constraint failed: bookings.topic"), False),
+    (sqlite3.IntegrityError("FOREIGN KEY constraint failed"), False),
+    (FakeConstraintError("uq_bookings_time_slot_id_when"), True),
+    (FakeConstraintError("bookings_guest_id_fkey"), False),
+])
+def test_only_the_unique_booking_index_counts_as_a_duplicate(orig: Exception, expected: bool):
+    assert _is_duplicate_booking(IntegrityError("INSERT INTO bookings ...", {}, orig)) is expected
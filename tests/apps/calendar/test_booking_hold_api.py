@@ -0,0 +1,194 @@
+import calendar
+from datetime import datetime, timedelta, timezone
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import func, select, update
+
+from appserver.apps.account.models import User
+from appserver.apps.account.utils import create_access_token
+from appserver.apps.calendar.holds import (
+    BookingHoldLimitError,
+    DatabaseBookingHoldTable,
+    InMemoryBookingHoldTable,
+    booking_holds,
+)
+from appserver.apps.calendar.models import BookingHold, TimeSlot
+from appserver.instrumentation import SQLInstrumentationMiddleware
+from appserver.libs.datetime.calendar import get_next_weekday
+
+
+@pytest.fixture()
+def hold_payload(time_slot_tuesday: TimeSlot) -> dict:
+    return {
+        "when": get_next_weekday(calendar.TUESDAY).isoformat(),
+        "time_slot_id": time_slot_tuesday.id,
+    }
+
+
+@pytest.fixture()
+def booking_payload(hold_payload: dict) -> dict:
+    return {**hold_payload, "topic": "test", "description": "test"}
+
+
+@pytest.fixture()
+def cute_guest_client(fastapi_app: FastAPI, cute_guest_user: User):
+    with TestClient(fastapi_app) as client:
+        client.cookies.set("auth_token", create_access_token({"sub": cute_guest_user.username}))
+        yield client
+
+
+async def test_guest_can_hold_and_then_book_a_slot(
+    host_user: User,
+    client_with_guest_auth: TestClient,
+    hold_payload: dict,
+    booking_payload: dict,
+):
+    response = client_with_guest_auth.post(f"/bookings/{host_user.username}/holds", json=hold_payload)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    data = response.json()
+    assert data["time_slot_id"] == hold_payload["time_slot_id"]
+    assert datetime.fromisoformat(data["expires_at"]) > datetime.now(timezone.utc)
+
+    response = client_with_guest_auth.post(f"/bookings/{host_user.username}", json=booking_payload)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert await booking_holds.get_owner(None, hold_payload["time_slot_id"], get_next_weekday(calendar.TUESDAY)) is None
+
+
+async def test_held_slot_rejects_other_guests_without_queries(
+    host_user: User,
+    guest_user: User,
+    cute_guest_user: User,
+    fastapi_app: FastAPI,
+    hold_payload: dict,
+    booking_payload: dict,
+):
+    fastapi_app.add_middleware(SQLInstrumentationMiddleware, debug=True)
+
+    with TestClient(fastapi_app) as client:
+        client.cookies.set("auth_token", create_access_token({"sub": guest_user.username}))
+        response = client.post(f"/bookings/{host_user.username}/holds", json=hold_payload)
+        assert response.status_code == status.HTTP_201_CREATED
+
+        client.cookies.set("auth_token", create_access_token({"sub": cute_guest_user.username}))
+        # Warm the user cache so only the hold check is counted.
+        client.get("/account/@me")
+        response = client.post(f"/bookings/{host_user.username}/holds", json=hold_payload)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.headers["X-DB-Query-Count"] == "0"
+
+        response = client.post(f"/bookings/{host_user.username}", json=booking_payload)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["detail"] == "The time slot is held by another guest."
+        assert response.headers["X-DB-Query-Count"] == "0"
+
+
+async def test_released_hold_frees_the_slot(
+    host_user: User,
+    client_with_guest_auth: TestClient,
+    cute_guest_client: TestClient,
+    hold_payload: dict,
+):
+    client_with_guest_auth.post(f"/bookings/{host_user.username}/holds", json=hold_payload)
+
+    response = client_with_guest_auth.delete(
+        f"/bookings/{host_user.username}/holds/{hold_payload['time_slot_id']}/{hold_payload['when']}"
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = cute_guest_client.post(f"/bookings/{host_user.username}/holds", json=hold_payload)
+    assert response.status_code == status.HTTP_201_CREATED
+
+
+async def test_invalid_hold_is_not_kept(
+    host_user: User,
+    client_with_guest_auth: TestClient,
+    hold_payload: dict,
+):
+    payload = {**hold_payload, "when": (get_next_weekday(calendar.TUESDAY) + timedelta(days=1)).isoformat()}
+
+    response = client_with_guest_auth.post(f"/bookings/{host_user.username}/holds", json=payload)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert await booking_holds.get_owner(None, payload["time_slot_id"], get_next_weekday(calendar.TUESDAY) + timedelta(days=1)) is None
+
+
+async def test_database_holds_expire(
+    db_session: AsyncSession,
+    guest_user: User,
+    cute_guest_user: User,
+    time_slot_tuesday: TimeSlot,
+):
+    holds = DatabaseBookingHoldTable(ttl=60, max_per_owner=3)
+    when = get_next_weekday(calendar.TUESDAY)
+
+    assert await holds.acquire(db_session, time_slot_tuesday.id, when, guest_user.id) is not None
+    assert await holds.acquire(db_session, time_slot_tuesday.id, when, cute_guest_user.id) is None
+    assert await holds.get_owner(db_session, time_slot_tuesday.id, when) == guest_user.id
+
+    await db_session.execute(
+        update(BookingHold).values(expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+    )
+    assert await holds.get_owner(db_session, time_slot_tuesday.id, when) is None
+    assert await holds.acquire(db_session, time_slot_tuesday.id, when, cute_guest_user.id) is not None
+    assert await holds.get_owner(db_session, time_slot_tuesday.id, when) == cute_guest_user.id
+
+    await holds.release(db_session, time_slot_tuesday.id, when, cute_guest_user.id)
+    assert await holds.get_owner(db_session, time_slot_tuesday.id, when) is None
+
+
+async def test_holding_again_does_not_extend_the_hold(
+    host_user: User,
+    client_with_guest_auth: TestClient,
+    hold_payload: dict,
+):
+    first = client_with_guest_auth.post(f"/bookings/{host_user.username}/holds", json=hold_payload)
+    second = client_with_guest_auth.post(f"/bookings/{host_user.username}/holds", json=hold_payload)
+
+    assert second.status_code == status.HTTP_201_CREATED
+    assert second.json()["expires_at"] == first.json()["expires_at"]
+
+
+@pytest.mark.parametrize("backend", ["memory", "database"])
+async def test_guest_live_holds_are_capped(
+    backend: str,
+    db_session: AsyncSession,
+    guest_user: User,
+    time_slot_tuesday: TimeSlot,
+):
+    if backend == "memory":
+        holds = InMemoryBookingHoldTable(ttl=60, max_per_owner=2, maxsize=100)
+    else:
+        holds = DatabaseBookingHoldTable(ttl=60, max_per_owner=2)
+    when = get_next_weekday(calendar.TUESDAY)
+
+    first = await holds.acquire(db_session, time_slot_tuesday.id, when, guest_user.id)
+    await holds.acquire(db_session, time_slot_tuesday.id, when + timedelta(days=7), guest_user.id)
+    assert await holds.acquire(db_session, time_slot_tuesday.id, when, guest_user.id) == first
+
+    with pytest.raises(BookingHoldLimitError):
+        await holds.acquire(db_session, time_slot_tuesday.id, when + timedelta(days=14), guest_user.id)
+
+    await holds.release(db_session, time_slot_tuesday.id, when, guest_user.id)
+    assert await holds.acquire(db_session, time_slot_tuesday.id, when + timedelta(days=14), guest_user.id) is not None
+
+
+async def test_expired_database_holds_are_purged(
+    db_session: AsyncSession,
+    guest_user: User,
+    time_slot_tuesday: TimeSlot,
+):
+    holds = DatabaseBookingHoldTable(ttl=60, max_per_owner=3)
+    when = get_next_weekday(calendar.TUESDAY)
+    await holds.acquire(db_session, time_slot_tuesday.id, when, guest_user.id)
+    await db_session.execute(
+        update(BookingHold).values(expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+    )
+
+    await holds.purge_expired(db_session)
+
+    result = await db_session.execute(select(func.count()).select_from(BookingHold))
+    assert result.scalar() == 0
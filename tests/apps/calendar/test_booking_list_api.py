@@ -0,0 +1,150 @@
+import csv
+import io
+import json
+import calendar
+from datetime import timedelta
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlmodel import select
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.endpoints import export_host_bookings
+from appserver.db import create_read_session
+from appserver.apps.calendar.models import Booking, TimeSlot
+from appserver.libs.datetime.calendar import get_next_weekday
+
+
+@pytest.fixture()
+async def weekly_bookings(
+    db_session: AsyncSession,
+    guest_user: User,
+    time_slot_tuesday: TimeSlot,
+) -> list[Booking]:
+    first_tuesday = get_next_weekday(calendar.TUESDAY)
+    bookings = [
+        Booking(
+            when=first_tuesday + timedelta(weeks=week),
+            topic=f"week {week}",
+            description="test",
+            time_slot_id=time_slot_tuesday.id,
+            guest_id=guest_user.id,
+        )
+        for week in (3, 0, 4, 1, 2)
+    ]
+    db_session.add_all(bookings)
+    await db_session.commit()
+    return sorted(bookings, key=lambda booking: (booking.when, booking.id))
+
+
+def collect_pages(client: TestClient, url: str, **params) -> list[list[dict]]:
+    pages = []
+    cursor = None
+    while True:
+        response = client.get(url, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        pages.append(data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+async def test_guest_bookings_are_paginated_by_date(
+    client_with_guest_auth: TestClient,
+    weekly_bookings: list[Booking],
+):
+    pages = collect_pages(client_with_guest_auth, "/bookings", limit=2)
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [item["id"] for page in pages for item in page] == [booking.id for booking in weekly_bookings]
+    assert pages[0][0]["start_time"] == "09:00:00"
+
+
+async def test_host_bookings_are_filtered_by_date_range(
+    client_with_auth: TestClient,
+    weekly_bookings: list[Booking],
+):
+    pages = collect_pages(
+        client_with_auth,
+        "/calendar/bookings",
+        **{"from": weekly_bookings[1].when.isoformat(), "to": weekly_bookings[3].when.isoformat()},
+    )
+
+    assert [item["id"] for item in pages[0]] == [booking.id for booking in weekly_bookings[1:4]]
+
+
+async def test_host_bookings_are_filtered_by_time_slot(
+    client_with_auth: TestClient,
+    weekly_bookings: list[Booking],
+):
+    response = client_with_auth.get("/calendar/bookings", params={"time_slot_id": 0})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"items": [], "next_cursor": None}
+
+
+async def test_guest_cannot_list_calendar_bookings(client_with_guest_auth: TestClient):
+    response = client_with_guest_auth.get("/calendar/bookings")
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.usefixtures("weekly_bookings")
+async def test_malformed_cursor_returns_422(client_with_guest_auth: TestClient):
+    response = client_with_guest_auth.get("/bookings", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_host_can_export_bookings_as_ndjson(
+    client_with_auth: TestClient,
+    guest_user: User,
+    weekly_bookings: list[Booking],
+):
+    response = client_with_auth.get("/calendar/bookings/export")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [booking.id for booking in weekly_bookings]
+    assert rows[0]["when"] == weekly_bookings[0].when.isoformat()
+    assert rows[0]["start_time"] == "09:00:00"
+    assert rows[0]["guest_username"] == guest_user.username
+
+
+async def test_host_can_export_bookings_as_csv(
+    client_with_auth: TestClient,
+    weekly_bookings: list[Booking],
+):
+    response = client_with_auth.get(
+        "/calendar/bookings/export",
+        params={"format": "csv", "from": weekly_bookings[3].when.isoformat()},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [int(row["id"]) for row in rows] == [booking.id for booking in weekly_bookings[3:]]
+    assert rows[0]["topic"] == weekly_bookings[3].topic
+
+
+async def test_export_streams_from_a_read_session_on_postgresql(
+    postgres_engine: AsyncEngine,
+    postgres_booking: Booking,
+):
+    async with create_read_session(postgres_engine)() as session:
+        result = await session.execute(select(User).where(User.username == "zipsa1234"))
+        host = result.scalar_one()
+        response = await export_host_bookings(host, session, "ndjson", None, None)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+
+    rows = [json.loads(line) for line in body.decode().splitlines()]
+    assert [row["id"] for row in rows] == [postgres_booking.id]
+
+
+async def test_guest_cannot_export_calendar_bookings(client_with_guest_auth: TestClient):
+    response = client_with_guest_auth.get("/calendar/bookings/export")
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
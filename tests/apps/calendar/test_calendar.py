@@ -1,4 +1,5 @@
 import pytest
+from fastapi import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from appserver.apps.account.models import User
 from appserver.apps.calendar.models import Calendar
@@ -28,7 +29,7 @@ async def test_get_calendar_info_from_host_user(
     }
     user = users[user_key]
 
-    result = await host_calendar_detail(host_user.username, user, db_session)
+    result = await host_calendar_detail(host_user.username, user, db_session, Response())
 
     assert isinstance(result, expected_type)
     result_keys = frozenset(result.model_dump().keys())
@@ -45,7 +46,7 @@ async def test_raise_host_not_found_error_for_nonexistent_user(
         db_session: AsyncSession,
 ) -> None:
     with pytest.raises(HostNotFoundError):
-        await host_calendar_detail("not_exist_user", None, db_session)
+        await host_calendar_detail("not_exist_user", None, db_session, Response())
 
 
 async def test_raise_calendar_not_found_error_for_not_host_user(
@@ -53,4 +54,4 @@ async def test_raise_calendar_not_found_error_for_not_host_user(
         db_session: AsyncSession,
 ) -> None:
     with pytest.raises(CalendarNotFoundError):
-        await host_calendar_detail(guest_user.username, None, db_session)
+        await host_calendar_detail(guest_user.username, None, db_session, Response())
@@ -1,12 +1,19 @@
-from fastapi import status
+import calendar
+from dataclasses import replace
+from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 import pytest
 
 from appserver.apps.account.models import User
-from appserver.apps.calendar.models import Calendar
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot
 from appserver.apps.calendar.schemas import CalendarDetailOut, CalendarOut
+from appserver.apps.calendar import endpoints
 from appserver.apps.calendar.endpoints import host_calendar_detail
+from appserver.apps.calendar.cache import calendar_feed_event_cache, calendar_page_cache
+from appserver.instrumentation import SQLInstrumentationMiddleware
 from appserver.libs.collections.sort import deduplicate_and_sort
+from appserver.libs.datetime.calendar import get_next_weekday
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 @pytest.mark.parametrize("user_key, expected_type", [
@@ -138,4 +145,106 @@ async def test_only_update_values_by_user_changed(
 
     for key in UPDATABLE_FIELDS - frozenset(payload.keys()):
         assert data[key] == before_data[key]
-        
\ No newline at end of file
+        
+
+async def test_calendar_detail_returns_304_when_etag_matches(
+    host_user: User,
+    host_user_calendar: Calendar,
+    client: TestClient,
+) -> None:
+    response = client.get(f"/calendar/{host_user.username}")
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+    assert response.headers["Last-Modified"]
+
+    response = client.get(f"/calendar/{host_user.username}", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    last_modified = client.get(f"/calendar/{host_user.username}").headers["Last-Modified"]
+    response = client.get(f"/calendar/{host_user.username}", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+async def test_calendar_detail_etag_differs_for_owner_and_changes_on_update(
+    host_user: User,
+    host_user_calendar: Calendar,
+    client: TestClient,
+    client_with_auth: TestClient,
+) -> None:
+    public_etag = client.get(f"/calendar/{host_user.username}").headers["ETag"]
+    owner_etag = client_with_auth.get(f"/calendar/{host_user.username}").headers["ETag"]
+    assert public_etag != owner_etag
+
+    response = client_with_auth.patch("/calendar", json={"description": "Updated description text"})
+    assert response.status_code == status.HTTP_200_OK
+
+    response = client.get(f"/calendar/{host_user.username}", headers={"If-None-Match": public_etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != public_etag
+
+
+async def test_public_calendar_page_is_served_from_cache_without_queries(
+    host_user: User,
+    host_user_calendar: Calendar,
+    fastapi_app: FastAPI,
+) -> None:
+    fastapi_app.add_middleware(SQLInstrumentationMiddleware, debug=True)
+
+    with TestClient(fastapi_app) as client:
+        first = client.get(f"/calendar/{host_user.username}")
+        second = client.get(f"/calendar/{host_user.username}")
+
+    assert first.status_code == status.HTTP_200_OK
+    assert first.headers["X-DB-Query-Count"] == "1"
+    assert second.status_code == status.HTTP_200_OK
+    assert second.headers["X-DB-Query-Count"] == "0"
+    assert second.json() == first.json()
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert calendar_page_cache.hits == 1
+
+
+async def test_calendar_page_cache_is_invalidated_when_calendar_is_updated(
+    host_user: User,
+    host_user_calendar: Calendar,
+    client: TestClient,
+    client_with_auth: TestClient,
+) -> None:
+    client.get(f"/calendar/{host_user.username}")
+    assert host_user.username in calendar_page_cache
+
+    owner_view = client_with_auth.get(f"/calendar/{host_user.username}")
+    assert "host_id" in owner_view.json()
+
+    response = client_with_auth.patch("/calendar", json={"description": "Updated description text"})
+    assert response.status_code == status.HTTP_200_OK
+    assert host_user.username not in calendar_page_cache
+
+    response = client.get(f"/calendar/{host_user.username}")
+    assert response.json()["description"] == "Updated description text"
+
+
+async def test_pages_read_from_a_replica_are_not_cached(
+    host_user: User,
+    guest_user: User,
+    time_slot_tuesday: TimeSlot,
+    db_session: AsyncSession,
+    client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    db_session.add(Booking(
+        when=get_next_weekday(calendar.TUESDAY),
+        topic="test",
+        description="test",
+        time_slot_id=time_slot_tuesday.id,
+        guest_id=guest_user.id,
+    ))
+    await db_session.commit()
+    monkeypatch.setattr(endpoints, "settings", replace(endpoints.settings, db_read_dsn="postgresql://app@replica/coffee"))
+
+    assert client.get(f"/calendar/{host_user.username}").status_code == status.HTTP_200_OK
+    assert client.get(f"/calendar/{host_user.username}/feed.ics").status_code == status.HTTP_200_OK
+
+    assert host_user.username not in calendar_page_cache
+    assert len(calendar_feed_event_cache) == 0
@@ -0,0 +1,150 @@
+import calendar
+from datetime import timedelta
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.cache import calendar_feed_event_cache
+from appserver.apps.calendar.endpoints import host_calendar_feed
+from appserver.apps.calendar.models import Booking, TimeSlot
+from appserver.db import create_read_session
+from appserver.libs.datetime.calendar import get_next_weekday
+
+
+@pytest.fixture()
+async def booking(
+    db_session: AsyncSession,
+    guest_user: User,
+    time_slot_tuesday: TimeSlot,
+) -> Booking:
+    booking = Booking(
+        when=get_next_weekday(calendar.TUESDAY),
+        topic="Career, chat; and more",
+        description="test",
+        time_slot_id=time_slot_tuesday.id,
+        guest_id=guest_user.id,
+    )
+    db_session.add(booking)
+    await db_session.commit()
+    return booking
+
+
+async def test_owner_feed_contains_booking_details(
+    client_with_auth: TestClient,
+    host_user: User,
+    booking: Booking,
+):
+    response = client_with_auth.get(f"/calendar/{host_user.username}/feed.ics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "text/calendar; charset=utf-8"
+    body = response.text
+    assert body.startswith("BEGIN:VCALENDAR\r\n")
+    assert body.endswith("END:VCALENDAR\r\n")
+    assert f"UID:booking-{booking.id}@coffee-chat-scheduler\r\n" in body
+    assert f"DTSTART:{booking.when.strftime('%Y%m%d')}T090000\r\n" in body
+    assert "SUMMARY:Career\\, chat\\; and more\r\n" in body
+
+
+async def test_public_feed_only_shows_busy_blocks(
+    client: TestClient,
+    host_user: User,
+    booking: Booking,
+):
+    response = client.get(f"/calendar/{host_user.username}/feed.ics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "SUMMARY:Busy\r\n" in response.text
+    assert booking.topic not in response.text
+
+
+async def test_feed_returns_304_for_matching_etag(
+    client: TestClient,
+    host_user: User,
+    booking: Booking,
+):
+    first = client.get(f"/calendar/{host_user.username}/feed.ics")
+    second = client.get(
+        f"/calendar/{host_user.username}/feed.ics",
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+
+    assert second.status_code == status.HTTP_304_NOT_MODIFIED
+    assert second.headers["ETag"] == first.headers["ETag"]
+
+
+async def test_feed_changes_when_host_is_renamed(
+    client_with_auth: TestClient,
+    host_user: User,
+    booking: Booking,
+):
+    first = client_with_auth.get(f"/calendar/{host_user.username}/feed.ics")
+
+    response = client_with_auth.patch("/account/@me", json={"display_name": "zipsanewname"})
+    assert response.status_code == status.HTTP_200_OK
+
+    second = client_with_auth.get(
+        f"/calendar/{host_user.username}/feed.ics",
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+
+    assert second.status_code == status.HTTP_200_OK
+    assert "X-WR-CALNAME:zipsanewname\r\n" in second.text
+
+
+async def test_feed_rerenders_only_changed_bookings(
+    client_with_auth: TestClient,
+    db_session: AsyncSession,
+    guest_user: User,
+    host_user: User,
+    time_slot_tuesday: TimeSlot,
+    booking: Booking,
+):
+    first = client_with_auth.get(f"/calendar/{host_user.username}/feed.ics")
+    assert calendar_feed_event_cache.misses == 1
+
+    other = Booking(
+        when=booking.when + timedelta(weeks=1),
+        topic="second",
+        description="test",
+        time_slot_id=time_slot_tuesday.id,
+        guest_id=guest_user.id,
+    )
+    db_session.add(other)
+    booking.topic = "renamed"
+    await db_session.commit()
+
+    second = client_with_auth.get(
+        f"/calendar/{host_user.username}/feed.ics",
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+
+    assert second.status_code == status.HTTP_200_OK
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert "SUMMARY:renamed\r\n" in second.text
+    assert "SUMMARY:second\r\n" in second.text
+    assert calendar_feed_event_cache.misses == 3
+
+    client_with_auth.get(f"/calendar/{host_user.username}/feed.ics")
+    assert calendar_feed_event_cache.misses == 3
+    assert calendar_feed_event_cache.hits == 2
+
+
+async def test_feed_streams_from_a_read_session_on_postgresql(
+    postgres_engine: AsyncEngine,
+    postgres_booking: Booking,
+):
+    async with create_read_session(postgres_engine)() as session:
+        response = await host_calendar_feed("zipsa1234", None, session, None, None)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+
+    assert body.count(b"BEGIN:VEVENT") == 1
+    assert body.endswith(b"END:VCALENDAR\r\n")
+
+
+async def test_feed_of_guest_user_returns_404(client: TestClient, guest_user: User):
+    response = client.get(f"/calendar/{guest_user.username}/feed.ics")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
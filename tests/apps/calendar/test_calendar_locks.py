@@ -0,0 +1,95 @@
+import asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlmodel import select
+
+from appserver.apps.calendar.locks import CalendarLockManager
+from appserver.db import create_session
+
+
+async def test_writes_to_one_calendar_are_serialized(db_session: AsyncSession):
+    locks = CalendarLockManager()
+    events = []
+
+    async def write(name: str):
+        async with locks.lock(db_session, 1):
+            events.append(f"{name} start")
+            await asyncio.sleep(0.01)
+            events.append(f"{name} end")
+
+    await asyncio.gather(write("a"), write("b"))
+
+    assert events == ["a start", "a end", "b start", "b end"]
+    assert locks.stats.acquisitions == 2
+    assert locks.stats.contended == 1
+    assert locks.stats.max_wait > 0
+    assert len(locks) == 0
+
+
+async def test_writes_to_different_calendars_run_in_parallel(db_session: AsyncSession):
+    locks = CalendarLockManager()
+    inside = asyncio.Event()
+
+    async def first():
+        async with locks.lock(db_session, 1):
+            await asyncio.wait_for(inside.wait(), 1)
+
+    async def second():
+        async with locks.lock(db_session, 2):
+            inside.set()
+
+    await asyncio.gather(first(), second())
+
+    assert locks.stats.contended == 0
+    assert len(locks) == 0
+
+
+async def test_lock_is_released_on_error(db_session: AsyncSession):
+    locks = CalendarLockManager()
+
+    try:
+        async with locks.lock(db_session, 1):
+            raise ValueError()
+    except ValueError:
+        pass
+
+    async with locks.lock(db_session, 1):
+        pass
+
+    assert locks.stats.snapshot()["acquisitions"] == 2
+    assert len(locks) == 0
+
+
+async def test_waiting_for_a_lock_does_not_hold_a_connection(tmp_path):
+    # One connection, as in the SQLite high-throughput profile's writer pool.
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'locks.db'}",
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=2,
+    )
+    session_factory = create_session(engine)
+    locks = CalendarLockManager()
+    first_has_connection = asyncio.Event()
+
+    async def holds_connection_then_locks():
+        async with session_factory() as session:
+            await session.execute(select(1))
+            first_has_connection.set()
+            async with locks.lock(session, 1):
+                await session.execute(select(1))
+
+    async def locks_then_needs_connection():
+        async with session_factory() as session:
+            async with locks.lock(session, 1):
+                await first_has_connection.wait()
+                await session.execute(select(1))
+
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(locks_then_needs_connection(), holds_connection_then_locks()),
+            timeout=1,
+        )
+    finally:
+        await engine.dispose()
+
+    assert locks.stats.acquisitions == 2
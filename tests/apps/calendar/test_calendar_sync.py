@@ -0,0 +1,241 @@
+import calendar
+from contextlib import asynccontextmanager
+from datetime import datetime, time, timedelta
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.cache import is_busy
+from appserver.apps.calendar.jobs import booking_created, job_queue
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot
+from appserver.apps.calendar.providers import BusyInterval, CalendarProviderError, FakeCalendarProvider
+from appserver.apps.calendar.sync import CalendarSyncWorker, booking_event_uid, calendar_sync_worker
+from appserver.libs.datetime.calendar import get_next_weekday
+
+
+@pytest.fixture()
+async def bookings(
+    db_session: AsyncSession,
+    guest_user: User,
+    time_slot_tuesday: TimeSlot,
+) -> list[Booking]:
+    first_tuesday = get_next_weekday(calendar.TUESDAY)
+    bookings = [
+        Booking(
+            when=first_tuesday + timedelta(weeks=week),
+            topic=f"week {week}",
+            description="test",
+            time_slot_id=time_slot_tuesday.id,
+            guest_id=guest_user.id,
+        )
+        for week in range(3)
+    ]
+    db_session.add_all(bookings)
+    await db_session.commit()
+    return bookings
+
+
+def make_worker(db_session: AsyncSession, provider: FakeCalendarProvider, **options) -> CalendarSyncWorker:
+    @asynccontextmanager
+    async def session_factory():
+        yield db_session
+
+    return CalendarSyncWorker(provider, session_factory=session_factory, retry_backoff=0, **options)
+
+
+async def test_push_bookings_sends_one_batch_per_calendar(
+    db_session: AsyncSession,
+    host_user_calendar: Calendar,
+    bookings: list[Booking],
+):
+    provider = FakeCalendarProvider()
+    worker = make_worker(db_session, provider)
+
+    await worker.push_bookings(db_session, [booking.id for booking in bookings])
+
+    assert provider.push_calls == 1
+    events = provider.events[host_user_calendar.google_calendar_id]
+    assert sorted(events) == sorted(booking_event_uid(booking.id) for booking in bookings)
+    event = events[booking_event_uid(bookings[0].id)]
+    assert event.start == datetime.combine(bookings[0].when, time(9, 0))
+    assert event.summary == bookings[0].topic
+
+
+async def test_push_is_retried_with_backoff(
+    db_session: AsyncSession,
+    host_user_calendar: Calendar,
+    bookings: list[Booking],
+):
+    provider = FakeCalendarProvider(failures=2)
+    worker = make_worker(db_session, provider, max_retries=2)
+
+    await worker.push_bookings(db_session, [bookings[0].id])
+
+    assert provider.push_calls == 3
+    assert booking_event_uid(bookings[0].id) in provider.events[host_user_calendar.google_calendar_id]
+
+
+async def test_push_gives_up_after_max_retries(
+    db_session: AsyncSession,
+    bookings: list[Booking],
+):
+    provider = FakeCalendarProvider(failures=10)
+    worker = make_worker(db_session, provider, max_retries=1)
+
+    await worker.push_bookings(db_session, [bookings[0].id])
+
+    assert provider.push_calls == 2
+    assert provider.events == {}
+
+
+async def test_worker_batches_queued_bookings(
+    db_session: AsyncSession,
+    host_user_calendar: Calendar,
+    bookings: list[Booking],
+):
+    provider = FakeCalendarProvider()
+    worker = make_worker(db_session, provider, pull_interval=3600)
+    worker.start()
+    try:
+        for booking in bookings:
+            worker.enqueue_booking(booking.id)
+        await worker.drain()
+    finally:
+        await worker.stop()
+
+    assert provider.push_calls == 1
+    assert len(provider.events[host_user_calendar.google_calendar_id]) == len(bookings)
+
+
+async def test_pushes_read_from_the_primary_session(
+    db_session: AsyncSession,
+    host_user_calendar: Calendar,
+    bookings: list[Booking],
+):
+    replica_sessions = []
+
+    @asynccontextmanager
+    async def primary_session_factory():
+        yield db_session
+
+    @asynccontextmanager
+    async def read_session_factory():
+        replica_sessions.append(True)
+        yield db_session
+
+    provider = FakeCalendarProvider()
+    worker = CalendarSyncWorker(
+        provider,
+        session_factory=primary_session_factory,
+        read_session_factory=read_session_factory,
+        pull_interval=3600,
+    )
+    worker.start()
+    try:
+        for booking in bookings:
+            worker.enqueue_booking(booking.id)
+        await worker.drain()
+    finally:
+        await worker.stop()
+
+    # Only the startup pull went to the replica.
+    assert len(replica_sessions) == 1
+    assert len(provider.events[host_user_calendar.google_calendar_id]) == len(bookings)
+
+
+async def test_busy_times_are_pulled_into_free_busy_cache(
+    db_session: AsyncSession,
+    host_user_calendar: Calendar,
+):
+    tuesday = get_next_weekday(calendar.TUESDAY)
+    provider = FakeCalendarProvider()
+    provider.busy[host_user_calendar.google_calendar_id] = [
+        BusyInterval(datetime.combine(tuesday, time(9, 30)), datetime.combine(tuesday, time(11, 0))),
+    ]
+    worker = make_worker(db_session, provider)
+
+    await worker.refresh_free_busy(db_session)
+
+    google_calendar_id = host_user_calendar.google_calendar_id
+    assert is_busy(google_calendar_id, datetime.combine(tuesday, time(9)), datetime.combine(tuesday, time(10)))
+    assert not is_busy(google_calendar_id, datetime.combine(tuesday, time(11)), datetime.combine(tuesday, time(12)))
+
+
+async def test_booking_and_availability_respect_cached_busy_times(
+    db_session: AsyncSession,
+    host_user: User,
+    host_user_calendar: Calendar,
+    time_slot_tuesday: TimeSlot,
+    client_with_guest_auth: TestClient,
+):
+    tuesday = get_next_weekday(calendar.TUESDAY)
+    provider = FakeCalendarProvider()
+    provider.busy[host_user_calendar.google_calendar_id] = [
+        BusyInterval(datetime.combine(tuesday, time(9)), datetime.combine(tuesday, time(10))),
+    ]
+    await make_worker(db_session, provider).refresh_free_busy(db_session)
+
+    response = client_with_guest_auth.get(
+        f"/calendar/{host_user.username}/availability",
+        params={"from": tuesday.isoformat(), "to": (tuesday + timedelta(days=7)).isoformat()},
+    )
+    assert [item["when"] for item in response.json()] == [(tuesday + timedelta(days=7)).isoformat()]
+
+    response = client_with_guest_auth.post(
+        f"/bookings/{host_user.username}",
+        json={
+            "when": tuesday.isoformat(),
+            "topic": "test",
+            "description": "test",
+            "time_slot_id": time_slot_tuesday.id,
+        },
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert provider.fetch_calls == 1
+
+
+async def test_create_booking_hands_off_to_sync_after_commit(
+    db_session: AsyncSession,
+    host_user: User,
+    time_slot_tuesday: TimeSlot,
+    client_with_guest_auth: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    submitted = []
+    monkeypatch.setattr(job_queue, "submit", submitted.append)
+
+    response = client_with_guest_auth.post(
+        f"/bookings/{host_user.username}",
+        json={
+            "when": get_next_weekday(calendar.TUESDAY).isoformat(),
+            "topic": "test",
+            "description": "test",
+            "time_slot_id": time_slot_tuesday.id,
+        },
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [(job.name, job.payload) for job in submitted] == [
+        ("booking.created", {"booking_id": response.json()["id"]}),
+    ]
+
+    provider = FakeCalendarProvider()
+    monkeypatch.setattr(calendar_sync_worker, "provider", provider)
+    await booking_created(db_session, **submitted[0].payload)
+    assert booking_event_uid(response.json()["id"]) in provider.events["1234567890"]
+
+
+async def test_booking_created_job_fails_when_the_push_fails(
+    db_session: AsyncSession,
+    host_user_calendar: Calendar,
+    bookings: list[Booking],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(calendar_sync_worker, "provider", FakeCalendarProvider(failures=1))
+    monkeypatch.setattr(calendar_sync_worker, "max_retries", 0)
+
+    # The job queue retries the job, and keeps its outbox row, instead of dropping the push.
+    with pytest.raises(CalendarProviderError):
+        await booking_created(db_session, booking_id=bookings[0].id)
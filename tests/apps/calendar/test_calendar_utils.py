@@ -0,0 +1,55 @@
+import calendar
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import func, select
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.utils import delete_user_calendar_data
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot
+from appserver.libs.datetime.calendar import get_next_weekday
+
+
+async def count(session: AsyncSession, model) -> int:
+    result = await session.execute(select(func.count()).select_from(model))
+    return result.scalar_one()
+
+
+async def test_host_calendar_data_is_deleted(
+    db_session: AsyncSession,
+    host_user: User,
+    guest_user: User,
+    time_slot_tuesday: TimeSlot,
+):
+    db_session.add(Booking(
+        when=get_next_weekday(calendar.TUESDAY),
+        topic="test",
+        description="test",
+        time_slot_id=time_slot_tuesday.id,
+        guest_id=guest_user.id,
+    ))
+    await db_session.commit()
+
+    assert await delete_user_calendar_data(db_session, host_user.id) == host_user.calendar.google_calendar_id
+
+    assert await count(db_session, Calendar) == 0
+    assert await count(db_session, TimeSlot) == 0
+    assert await count(db_session, Booking) == 0
+
+
+async def test_guest_bookings_are_deleted(
+    db_session: AsyncSession,
+    guest_user: User,
+    time_slot_tuesday: TimeSlot,
+):
+    db_session.add(Booking(
+        when=get_next_weekday(calendar.TUESDAY),
+        topic="test",
+        description="test",
+        time_slot_id=time_slot_tuesday.id,
+        guest_id=guest_user.id,
+    ))
+    await db_session.commit()
+
+    assert await delete_user_calendar_data(db_session, guest_user.id) is None
+
+    assert await count(db_session, Booking) == 0
+    assert await count(db_session, TimeSlot) == 1
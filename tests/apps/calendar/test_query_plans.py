@@ -0,0 +1,75 @@
+import os
+from datetime import date, time
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlmodel import SQLModel, select, tuple_
+
+from appserver.apps.calendar.models import Booking, TimeSlot
+
+
+HOT_QUERIES = [
+    pytest.param(
+        select(Booking.id)
+        .where(Booking.guest_id == 1)
+        .where(tuple_(Booking.when, Booking.id) > (date(2026, 1, 6), 10))
+        .order_by(Booking.when, Booking.id)
+        .limit(51),
+        ("ix_bookings_guest_id_when",),
+        id="guest_bookings-keyset-page",
+    ),
+    pytest.param(
+        select(Booking.id)
+        .where(Booking.time_slot_id == 1)
+        .where(Booking.when == date(2026, 1, 6)),
+        ("uq_bookings_time_slot_id_when",),
+        id="booking-occupancy-by-time-slot-and-date",
+    ),
+    pytest.param(
+        select(TimeSlot.id).where(
+            TimeSlot.calendar_id == 1,
+            TimeSlot.start_time < time(11, 0),
+            TimeSlot.end_time > time(10, 0),
+        ),
+        ("ix_time_slots_calendar_id_start_time_end_time",),
+        id="create_time_slot-overlap-range-scan",
+    ),
+]
+
+
+async def explain(session: AsyncSession, stmt, prefix: str) -> str:
+    compiled = stmt.compile(dialect=session.bind.dialect, compile_kwargs={"literal_binds": True})
+    result = await session.execute(text(f"{prefix} {compiled}"))
+    return "\n".join(" ".join(str(value) for value in row) for row in result.all())
+
+
+@pytest.mark.parametrize("stmt, index_names", HOT_QUERIES)
+async def test_hot_query_uses_index_on_sqlite(db_session: AsyncSession, stmt, index_names: tuple[str, ...]):
+    plan = await explain(db_session, stmt, "EXPLAIN QUERY PLAN")
+
+    assert any(index_name in plan for index_name in index_names), plan
+
+
+@pytest.fixture()
+async def postgres_session():
+    dsn = os.environ.get("APPSERVER_TEST_POSTGRES_DSN")
+    if not dsn:
+        pytest.skip("APPSERVER_TEST_POSTGRES_DSN is not set")
+    pytest.importorskip("asyncpg")
+
+    engine = create_async_engine(dsn)
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        await conn.run_sync(SQLModel.metadata.create_all)
+        # Tables are empty, so force the planner to show whether an index is usable.
+        await conn.execute(text("SET LOCAL enable_seqscan = off"))
+        yield AsyncSession(bind=conn)
+        await transaction.rollback()
+    await engine.dispose()
+
+
+@pytest.mark.parametrize("stmt, index_names", HOT_QUERIES)
+async def test_hot_query_uses_index_on_postgresql(postgres_session: AsyncSession, stmt, index_names: tuple[str, ...]):
+    plan = await explain(postgres_session, stmt, "EXPLAIN")
+
+    assert any(index_name in plan for index_name in index_names), plan
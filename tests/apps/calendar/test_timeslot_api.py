@@ -1,9 +1,16 @@
 from datetime import time
 import pytest
-from fastapi import status
+from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import func, select
 import calendar
 
+from appserver.apps.account.models import User
+from appserver.apps.account.utils import create_access_token
+from appserver.apps.calendar.models import TimeSlot
+from appserver.instrumentation import SQLInstrumentationMiddleware
+
 @pytest.mark.usefixtures("host_user_calendar")
 async def test_host_user_can_create_timeslot_with_valid_information(
     client_with_auth: TestClient,
@@ -103,3 +110,148 @@ async def test_returns_422_when_timeslots_overlap(
     }
     response = client_with_auth.post("/time-slots", json=payload)
     assert response.status_code == expected_status_code
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+async def test_weekday_mask_is_stored_with_created_timeslot(
+    client_with_auth: TestClient,
+    db_session: AsyncSession,
+):
+    payload = {
+        "start_time": time(10, 0).isoformat(),
+        "end_time": time(11, 0).isoformat(),
+        "weekdays": [calendar.MONDAY, calendar.WEDNESDAY],
+    }
+
+    response = client_with_auth.post("/time-slots", json=payload)
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["weekdays"] == payload["weekdays"]
+
+    result = await db_session.execute(select(TimeSlot.weekday_mask))
+    assert result.scalar_one() == 0b101
+
+
+async def test_weekday_mask_follows_weekdays_on_update(
+    db_session: AsyncSession,
+    time_slot_tuesday: TimeSlot,
+):
+    assert time_slot_tuesday.weekday_mask == 1 << calendar.TUESDAY
+
+    time_slot_tuesday.weekdays = [calendar.FRIDAY, calendar.SUNDAY]
+    await db_session.commit()
+
+    assert time_slot_tuesday.weekday_mask == (1 << calendar.FRIDAY) | (1 << calendar.SUNDAY)
+
+
+async def test_weekday_mask_follows_in_place_weekday_changes(
+    db_session: AsyncSession,
+    time_slot_tuesday: TimeSlot,
+):
+    time_slot_tuesday.weekdays.append(calendar.THURSDAY)
+    await db_session.commit()
+
+    result = await db_session.execute(
+        select(TimeSlot.weekdays, TimeSlot.weekday_mask).where(TimeSlot.id == time_slot_tuesday.id)
+    )
+    assert tuple(result.one()) == (
+        [calendar.TUESDAY, calendar.THURSDAY],
+        (1 << calendar.TUESDAY) | (1 << calendar.THURSDAY),
+    )
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+async def test_host_user_can_create_timeslots_in_batch(
+    client_with_auth: TestClient,
+    db_session: AsyncSession,
+):
+    payload = [
+        {
+            "start_time": time(hour, 0).isoformat(),
+            "end_time": time(hour + 1, 0).isoformat(),
+            "weekdays": [calendar.MONDAY, calendar.FRIDAY],
+        }
+        for hour in range(9, 17)
+    ]
+
+    response = client_with_auth.post("/time-slots:batch", json=payload)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [item["start_time"] for item in response.json()] == [item["start_time"] for item in payload]
+
+    result = await db_session.execute(select(TimeSlot.weekday_mask))
+    assert result.scalars().all() == [(1 << calendar.MONDAY) | (1 << calendar.FRIDAY)] * len(payload)
+
+
+async def test_batch_reports_every_overlap_at_once(
+    client_with_auth: TestClient,
+    db_session: AsyncSession,
+    time_slot_tuesday: TimeSlot,
+):
+    payload = [
+        {
+            "start_time": time(9, 0).isoformat(),
+            "end_time": time(10, 30).isoformat(),
+            "weekdays": [calendar.MONDAY],
+        },
+        {
+            "start_time": time(10, 0).isoformat(),
+            "end_time": time(11, 0).isoformat(),
+            "weekdays": [calendar.MONDAY],
+        },
+        {
+            "start_time": time_slot_tuesday.start_time.isoformat(),
+            "end_time": time_slot_tuesday.end_time.isoformat(),
+            "weekdays": [calendar.TUESDAY],
+        },
+        {
+            "start_time": time(20, 0).isoformat(),
+            "end_time": time(21, 0).isoformat(),
+            "weekdays": [calendar.MONDAY, calendar.TUESDAY],
+        },
+    ]
+
+    response = client_with_auth.post("/time-slots:batch", json=payload)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json()["detail"]["conflicts"] == [
+        {"index": 0, "weekday": calendar.MONDAY, "conflicts_with": 1},
+        {"index": 2, "weekday": calendar.TUESDAY, "conflicts_with": {"time_slot_id": time_slot_tuesday.id}},
+    ]
+
+    result = await db_session.execute(select(func.count()).select_from(TimeSlot))
+    assert result.scalar_one() == 1
+
+
+async def test_guest_user_cannot_create_timeslots_in_batch(client_with_guest_auth: TestClient):
+    payload = [{
+        "start_time": time(10, 0).isoformat(),
+        "end_time": time(11, 0).isoformat(),
+        "weekdays": [calendar.MONDAY],
+    }]
+
+    response = client_with_guest_auth.post("/time-slots:batch", json=payload)
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.usefixtures("host_user_calendar")
+async def test_create_timeslot_returns_server_defaults_without_refresh(
+    host_user: User,
+    fastapi_app: FastAPI,
+):
+    fastapi_app.add_middleware(SQLInstrumentationMiddleware, debug=True)
+    payload = {
+        "start_time": time(10, 0).isoformat(),
+        "end_time": time(11, 0).isoformat(),
+        "weekdays": [calendar.MONDAY],
+    }
+
+    with TestClient(fastapi_app) as client:
+        client.cookies.set("auth_token", create_access_token({"sub": host_user.username}))
+        client.get("/account/@me")
+        response = client.post("/time-slots", json=payload)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["created_at"] is not None
+    # Overlap check, INSERT ... RETURNING.
+    assert response.headers["X-DB-Query-Count"] == "2"
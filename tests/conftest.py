@@ -1,10 +1,12 @@
+import importlib.util
+import os
 import pytest
 import calendar
 from datetime import time
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
-from appserver.db import create_async_engine, create_session, use_session
+from appserver.db import create_async_engine, create_session, use_read_session, use_session
 from appserver.app import include_routers
 from appserver.db import create_async_engine, create_session
 from appserver.apps.account import models as account_models
@@ -13,6 +15,35 @@ from sqlmodel import SQLModel
 from appserver.apps.account.utils import hash_password
 from appserver.apps.account.schemas import LoginPayload
 from appserver.apps.calendar import models as calendar_models
+from appserver.apps.account.cache import revoked_tokens, token_cache, user_cache
+from appserver.apps.calendar.cache import calendar_feed_event_cache, calendar_page_cache, free_busy_cache
+from appserver.apps.calendar.holds import InMemoryBookingHoldTable, booking_holds
+from appserver.libs.datetime.calendar import get_next_weekday
+from appserver.settings import Settings
+
+
+def clear_booking_holds():
+    if isinstance(booking_holds, InMemoryBookingHoldTable):
+        booking_holds.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    token_cache.clear()
+    user_cache.clear()
+    revoked_tokens.clear()
+    calendar_page_cache.clear()
+    calendar_feed_event_cache.clear()
+    free_busy_cache.clear()
+    clear_booking_holds()
+    yield
+    token_cache.clear()
+    user_cache.clear()
+    revoked_tokens.clear()
+    calendar_page_cache.clear()
+    calendar_feed_event_cache.clear()
+    free_busy_cache.clear()
+    clear_booking_holds()
 
 
 @pytest.fixture(autouse=True)
@@ -36,6 +67,64 @@ async def db_session():
     await engine.dispose()
 
 
+@pytest.fixture()
+async def postgres_engine():
+    # asyncpg cursors and read-only transactions behave differently from SQLite, so
+    # those paths run against a real server when one is configured.
+    dsn = os.environ.get("APPSERVER_TEST_POSTGRES_DSN")
+    if not dsn or importlib.util.find_spec("asyncpg") is None:
+        pytest.skip("PostgreSQL tests need asyncpg and APPSERVER_TEST_POSTGRES_DSN")
+
+    engine = create_async_engine(Settings(db_dsn=dsn).database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield engine
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest.fixture()
+async def postgres_booking(postgres_engine) -> calendar_models.Booking:
+    async with create_session(postgres_engine)() as session:
+        host = account_models.User(
+            username="zipsa1234",
+            hashed_password="x",
+            email="test@example.com",
+            display_name="zipsahere",
+            is_host=True,
+        )
+        guest = account_models.User(
+            username="zipsacafe",
+            hashed_password="x",
+            email="zipsacafe@example.com",
+            display_name="ZIPSAoCAFE",
+        )
+        host_calendar = calendar_models.Calendar(
+            host=host,
+            description="zipsa calendar here",
+            topics=["zipsa talk"],
+            google_calendar_id="1234567890",
+        )
+        time_slot = calendar_models.TimeSlot(
+            calendar=host_calendar,
+            start_time=time(10, 0),
+            end_time=time(11, 0),
+            weekdays=[calendar.TUESDAY],
+        )
+        booking = calendar_models.Booking(
+            when=get_next_weekday(calendar.TUESDAY),
+            topic="test",
+            description="test",
+            time_slot=time_slot,
+            guest=guest,
+        )
+        session.add(booking)
+        await session.commit()
+        return booking
+
+
 @pytest.fixture()
 def fastapi_app(db_session: AsyncSession):
     app = FastAPI()
@@ -45,6 +134,7 @@ def fastapi_app(db_session: AsyncSession):
         yield db_session
 
     app.dependency_overrides[use_session] = override_use_session
+    app.dependency_overrides[use_read_session] = override_use_session
     return app
     
     
@@ -1,7 +1,10 @@
+from datetime import date, timedelta
 from appserver.libs.datetime.calendar import (
     get_start_weekday_of_month, 
     get_last_day_of_month,
-    get_range_days_of_month
+    get_range_days_of_month,
+    get_range_days_of_months,
+    get_weekday_dates_in_range,
 )
 import pytest
 
@@ -46,3 +49,41 @@ expected_total_count):
     assert sum(padding_count) == 0
     assert days[expected_padding_count] == 1
     assert len(days) == expected_total_count
+
+
+@pytest.mark.parametrize("year, month, count", [
+    (2024, 1, 12),
+    (2024, 11, 3),  # crosses a year boundary
+    (2025, 2, 1),
+])
+def test_get_range_days_of_months_matches_single_month_grids(year, month, count):
+    grids = get_range_days_of_months(year, month, count)
+
+    assert len(grids) == count
+    for offset, grid in enumerate(grids):
+        index = year * 12 + month - 1 + offset
+        assert grid == get_range_days_of_month(index // 12, index % 12 + 1)
+
+
+@pytest.mark.parametrize("weekdays", [
+    [0],
+    [1, 3],
+    [6, 0, 5],
+    list(range(7)),
+    [],
+])
+@pytest.mark.parametrize("start, days", [
+    (date(2024, 12, 1), 0),
+    (date(2024, 12, 1), 6),
+    (date(2024, 12, 4), 90),
+    (date(2024, 2, 27), 400),
+])
+def test_get_weekday_dates_in_range_matches_day_by_day_scan(weekdays, start, days):
+    end = start + timedelta(days=days)
+    expected = [
+        start + timedelta(days=offset)
+        for offset in range(days + 1)
+        if (start + timedelta(days=offset)).weekday() in weekdays
+    ]
+
+    assert get_weekday_dates_in_range(weekdays, start, end) == expected
@@ -0,0 +1,109 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from appserver.apps.account.models import User
+from appserver.db import create_engines, create_read_session, engine_options
+from appserver.settings import Settings
+
+
+def test_settings_are_read_from_environment():
+    settings = Settings.from_env({
+        "APPSERVER_DB_DSN": "postgres://app:secret@db:5432/coffee",
+        "APPSERVER_DB_POOL_SIZE": "20",
+        "APPSERVER_DB_MAX_OVERFLOW": "0",
+        "APPSERVER_DB_POOL_PRE_PING": "false",
+        "APPSERVER_DB_STATEMENT_TIMEOUT_MS": "5000",
+    })
+
+    assert settings.database_url == "postgresql+asyncpg://app:secret@db:5432/coffee"
+    assert settings.db_pool_size == 20
+    assert settings.db_max_overflow == 0
+    assert settings.db_pool_pre_ping is False
+    assert settings.db_statement_timeout_ms == 5000
+
+
+def test_postgresql_engine_options_include_pool_and_statement_timeout():
+    settings = Settings(
+        db_dsn="postgresql://app@db/coffee",
+        db_pool_size=20,
+        db_statement_timeout_ms=5000,
+    )
+
+    options = engine_options(settings)
+
+    assert options["pool_size"] == 20
+    assert options["connect_args"] == {"server_settings": {"statement_timeout": "5000"}}
+
+
+def test_sqlite_engine_options_skip_pool_sizing():
+    options = engine_options(Settings(db_dsn="sqlite+aiosqlite:///:memory:"))
+
+    assert "pool_size" not in options
+    assert "max_overflow" not in options
+
+
+async def test_sqlite_high_throughput_profile_splits_reader_and_writer(tmp_path):
+    settings = Settings(
+        db_dsn=f"sqlite+aiosqlite:///{tmp_path / 'bench.db'}",
+        db_sqlite_high_throughput=True,
+    )
+
+    write_engine, read_engine = create_engines(settings)
+    try:
+        assert read_engine is not None
+        assert write_engine.pool.size() == 1
+
+        async with write_engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1
+        async with read_engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 1
+    finally:
+        await write_engine.dispose()
+        await read_engine.dispose()
+
+
+async def test_read_replica_engine_uses_query_only_connections(tmp_path):
+    settings = Settings(
+        db_dsn=f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}",
+        db_read_dsn=f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}",
+    )
+
+    write_engine, read_engine = create_engines(settings)
+    try:
+        assert str(read_engine.url).endswith("replica.db")
+        async with read_engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 1
+        async with write_engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 0
+    finally:
+        await write_engine.dispose()
+        await read_engine.dispose()
+
+
+async def test_read_sessions_autocommit_and_refuse_writes(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'read.db'}")
+    try:
+        async with create_read_session(engine)() as session:
+            await session.execute(text("SELECT 1"))
+            connection = await session.connection()
+            raw_connection = await connection.get_raw_connection()
+            assert raw_connection.driver_connection.in_transaction is False
+
+            session.add(User(username="reader", email="reader@example.com", display_name="reader", hashed_password="x"))
+            with pytest.raises(InvalidRequestError):
+                await session.flush()
+    finally:
+        await engine.dispose()
+
+
+async def test_read_sessions_stream_on_postgresql(postgres_engine: AsyncEngine):
+    # asyncpg opens server-side cursors only inside a transaction.
+    async with create_read_session(postgres_engine)() as session:
+        result = await session.stream(
+            text("SELECT n FROM generate_series(1, 10) AS n").execution_options(yield_per=3)
+        )
+        values = [row.n async for row in result]
+
+    assert values == list(range(1, 11))
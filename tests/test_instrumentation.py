@@ -0,0 +1,61 @@
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from appserver.apps.account.models import User
+from appserver.instrumentation import (
+    SQLInstrumentationMiddleware,
+    install_sql_instrumentation,
+    query_report,
+    track_queries,
+)
+
+
+def test_query_stats_are_sent_as_headers_in_debug_mode(fastapi_app: FastAPI, host_user: User):
+    fastapi_app.add_middleware(SQLInstrumentationMiddleware, debug=True)
+    query_report.clear()
+
+    with TestClient(fastapi_app) as client:
+        response = client.get(f"/account/users/{host_user.username}")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-DB-Query-Count"] == "1"
+    assert float(response.headers["X-DB-Time-Ms"]) > 0
+    report = query_report.snapshot()["GET /account/users/{username}"]
+    assert report["requests"] == 1
+    assert report["max_queries"] == 1
+    assert report["slowest_statement"].startswith("SELECT")
+    assert report["slowest_ms"] > 0
+
+
+def test_unmatched_requests_share_one_report_entry(fastapi_app: FastAPI):
+    fastapi_app.add_middleware(SQLInstrumentationMiddleware)
+    query_report.clear()
+
+    with TestClient(fastapi_app) as client:
+        for n in range(5):
+            client.get(f"/random/{n}")
+
+    assert list(query_report.snapshot()) == ["GET <unmatched>"]
+    assert query_report.snapshot()["GET <unmatched>"]["requests"] == 5
+
+
+def test_query_stats_headers_are_hidden_outside_debug_mode(fastapi_app: FastAPI, host_user: User):
+    fastapi_app.add_middleware(SQLInstrumentationMiddleware, debug=False)
+
+    with TestClient(fastapi_app) as client:
+        response = client.get(f"/account/users/{host_user.username}")
+
+    assert "X-DB-Query-Count" not in response.headers
+
+
+async def test_repeated_statements_are_detected(db_session: AsyncSession):
+    install_sql_instrumentation()
+
+    with track_queries() as stats:
+        for user_id in range(3):
+            await db_session.execute(text("SELECT id FROM users WHERE id = :id"), {"id": user_id})
+        await db_session.execute(text("SELECT count(*) FROM users"))
+
+    assert stats.query_count == 4
+    assert stats.repeated_statements(threshold=3) == {"SELECT id FROM users WHERE id = ?": 3}
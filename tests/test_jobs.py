@@ -0,0 +1,202 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import func, select, update
+
+from appserver.jobs import JobQueue
+from appserver.jobs.models import OutboxJob
+
+
+def make_queue(db_session: AsyncSession, **options) -> JobQueue:
+    @asynccontextmanager
+    async def session_factory():
+        yield db_session
+
+    return JobQueue(session_factory=session_factory, retry_backoff=0, **options)
+
+
+async def test_staged_job_runs_only_after_commit(db_session: AsyncSession):
+    queue = make_queue(db_session)
+    calls = []
+
+    @queue.job("greet")
+    async def greet(session: AsyncSession, name: str) -> None:
+        calls.append((session, name))
+
+    queue.start()
+    try:
+        queue.stage(db_session, "greet", name="zipsa")
+        await asyncio.sleep(0)
+        assert calls == []
+
+        await db_session.commit()
+        await queue.drain()
+    finally:
+        await queue.stop()
+
+    assert calls == [(db_session, "zipsa")]
+
+
+async def test_rollback_discards_staged_jobs(db_session: AsyncSession):
+    queue = make_queue(db_session)
+    calls = []
+
+    @queue.job("greet")
+    async def greet(session: AsyncSession, name: str) -> None:
+        calls.append(name)
+
+    queue.start()
+    try:
+        await db_session.execute(select(func.count()).select_from(OutboxJob))
+        queue.stage(db_session, "greet", name="zipsa")
+        await db_session.rollback()
+        await db_session.commit()
+        await queue.drain()
+    finally:
+        await queue.stop()
+
+    assert calls == []
+
+
+async def test_failed_job_is_retried(db_session: AsyncSession):
+    queue = make_queue(db_session)
+    attempts = []
+
+    @queue.job("flaky", max_retries=3)
+    async def flaky(session: AsyncSession) -> None:
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RuntimeError("try again")
+
+    queue.start()
+    try:
+        queue.stage(db_session, "flaky")
+        await db_session.commit()
+        await queue.drain()
+    finally:
+        await queue.stop()
+
+    assert len(attempts) == 3
+
+
+async def test_concurrency_is_limited_per_job_type(db_session: AsyncSession):
+    queue = make_queue(db_session)
+    running = 0
+    peak = 0
+
+    @queue.job("slow", concurrency=2)
+    async def slow(session: AsyncSession) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    queue.start()
+    try:
+        for _ in range(6):
+            queue.stage(db_session, "slow")
+        await db_session.commit()
+        await queue.drain()
+    finally:
+        await queue.stop()
+
+    assert peak == 2
+
+
+async def test_stop_drains_queued_jobs(db_session: AsyncSession):
+    queue = make_queue(db_session)
+    done = []
+
+    @queue.job("slow")
+    async def slow(session: AsyncSession, n: int) -> None:
+        await asyncio.sleep(0.01)
+        done.append(n)
+
+    queue.start()
+    for n in range(3):
+        queue.stage(db_session, "slow", n=n)
+    await db_session.commit()
+    await queue.stop(timeout=5)
+
+    assert done == [0, 1, 2]
+
+
+async def test_durable_job_is_written_to_outbox_with_the_transaction(db_session: AsyncSession):
+    queue = make_queue(db_session, durable=True)
+    calls = []
+
+    @queue.job("greet")
+    async def greet(session: AsyncSession, name: str) -> None:
+        calls.append(name)
+
+    queue.stage(db_session, "greet", name="zipsa")
+    await db_session.commit()
+
+    result = await db_session.execute(select(OutboxJob.name, OutboxJob.payload))
+    assert result.all() == [("greet", {"name": "zipsa"})]
+
+    # The job survives until a running queue claims it from the outbox.
+    queue.start()
+    try:
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if calls:
+                break
+        await queue.drain()
+    finally:
+        await queue.stop()
+
+    assert calls == ["zipsa"]
+    result = await db_session.execute(select(func.count()).select_from(OutboxJob))
+    assert result.scalar_one() == 0
+
+
+async def test_claimed_outbox_jobs_are_leased(db_session: AsyncSession):
+    queue = make_queue(db_session, durable=True, lease=60)
+
+    @queue.job("greet")
+    async def greet(session: AsyncSession, name: str) -> None:
+        pass
+
+    queue.stage(db_session, "greet", name="zipsa")
+    queue.stage(db_session, "greet", name="kim")
+    await db_session.commit()
+
+    first = await queue.claim_outbox_jobs(db_session)
+    second = await queue.claim_outbox_jobs(db_session)
+
+    assert [job.payload["name"] for job in first] == ["zipsa", "kim"]
+    assert second == []
+
+    # Once the lease runs out, the job is claimed again.
+    await db_session.execute(
+        update(OutboxJob).values(available_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+    )
+    await db_session.commit()
+    assert len(await queue.claim_outbox_jobs(db_session)) == 2
+
+
+async def test_durable_job_is_marked_failed_after_retries(db_session: AsyncSession):
+    queue = make_queue(db_session, durable=True)
+
+    @queue.job("broken", max_retries=0)
+    async def broken(session: AsyncSession) -> None:
+        raise RuntimeError("boom")
+
+    queue.stage(db_session, "broken")
+    await db_session.commit()
+    queue.start()
+    try:
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            result = await db_session.execute(select(OutboxJob.failed_at, OutboxJob.last_error))
+            failed_at, last_error = result.one()
+            if failed_at is not None:
+                break
+    finally:
+        await queue.stop()
+
+    assert failed_at is not None
+    assert "boom" in last_error